@@ -12,18 +12,38 @@ Example:
     >>> print(f"Parsed {len(result['ast']['lines'])} lines")
     Parsed 2 lines
     >>>
-    >>> # Validate a CODEOWNERS file
-    >>> result = validate_codeowners("*.rs @rustacean\\n", "/path/to/repo")
+    >>> # Bytes read from disk can be passed without decoding first
+    >>> with open(".github/CODEOWNERS", "rb") as f:
+    ...     result = parse_codeowners(f.read())
+    >>>
+    >>> # Validate the CODEOWNERS file of a repository (located automatically)
+    >>> import asyncio
+    >>> result = asyncio.run(validate_codeowners("/path/to/repo"))
     >>> if not result["syntax"]:
     ...     print("No syntax errors!")
     No syntax errors!
 
+Caching:
+    ``parse_codeowners`` memoizes its results by content, so parsing the same
+    text twice returns the same (frozen) result object. Call
+    ``parse_codeowners.cache_clear()`` to release cached entries.
+
+    Config dicts passed to ``validate_codeowners`` are converted on every
+    call. Call ``compile_check_config()`` once and pass the resulting
+    ``CompiledCheckConfig`` to reuse the converted form.
+
+    To validate the same content repeatedly, ``compile_codeowners()`` parses
+    it once and returns a ``CompiledCodeowners`` whose ``validate()`` method
+    reuses the AST.
+
 Types:
     The following types are available for type annotations:
 
     - ``GithubClientProtocol``: Protocol for implementing custom GitHub clients
     - ``CheckConfigDict``: Configuration options for validation
-    - ``ParseResultDict``: Return type of ``parse_codeowners()``
+    - ``ParseResult``: Frozen return type of ``parse_codeowners()``, with
+      nested ``Ast``, ``Line``, ``LineKind``, ``Pattern``, ``Owner`` and ``Span``
+    - ``ParseResultDict``: Plain-dict form of ``ParseResult.to_dict()``
     - ``ValidationResultDict``: Return type of ``validate_codeowners()``
     - ``IssueDict``: Individual validation issue
     - ``SpanDict``: Location information in source
@@ -41,39 +61,107 @@ Example with type annotations:
     ...         return "exists"
 """
 
+from typing import TYPE_CHECKING, Any
+
+from codeowners_validator._cache import parse_codeowners
 from codeowners_validator._codeowners_validator import (
+    HAS_GENERATE,
+    Ast,
+    CompiledCheckConfig,
+    CompiledCodeowners,
+    Line,
+    LineKind,
+    Owner,
+    ParseResult,
+    Pattern,
+    Span,
     __version__,
-    parse_codeowners,
+    compile_check_config,
+    compile_codeowners,
     validate_codeowners,
+    validate_codeowners_batch,
 )
-from codeowners_validator._types import (
-    AstDict,
-    CheckConfigDict,
-    GithubClientProtocol,
-    IssueDict,
-    LineDict,
-    LineKindDict,
-    OwnerDict,
-    ParseResultDict,
-    PatternDict,
-    SpanDict,
-    ValidationResultDict,
+
+if TYPE_CHECKING:
+    from codeowners_validator._types import (
+        AstDict,
+        CheckConfigDict,
+        GithubClientProtocol,
+        IssueDict,
+        LineDict,
+        LineKindDict,
+        OwnerDict,
+        ParseResultDict,
+        PatternDict,
+        SpanDict,
+        ValidationResultDict,
+    )
+
+# Type exports resolved lazily from ``_types`` by ``__getattr__`` (PEP 562)
+_TYPE_NAMES = frozenset(
+    {
+        "AstDict",
+        "CheckConfigDict",
+        "GithubClientProtocol",
+        "IssueDict",
+        "LineDict",
+        "LineKindDict",
+        "OwnerDict",
+        "ParseResultDict",
+        "PatternDict",
+        "SpanDict",
+        "ValidationResultDict",
+    }
 )
 
-# The generate function is available when built with the 'generate' feature (default)
-try:
-    from codeowners_validator._codeowners_validator import generate_codeowners_fixture
-except ImportError:
+
+def __getattr__(name: str) -> Any:
+    """Import type definitions on first access instead of at package import."""
+    if name in _TYPE_NAMES:
+        from codeowners_validator import _types
+
+        value = getattr(_types, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+# The generate functions are available when built with the 'generate' feature (default)
+if HAS_GENERATE:
+    from codeowners_validator._codeowners_validator import (
+        PatternVocabulary,
+        generate_codeowners_fixture,
+        generate_codeowners_lines,
+    )
+else:
+    PatternVocabulary = None  # type: ignore[assignment,misc]
     generate_codeowners_fixture = None  # type: ignore[assignment,misc]
+    generate_codeowners_lines = None  # type: ignore[assignment,misc]
 
 __all__ = [
-    # Version
+    # Version and build features
     "__version__",
+    "HAS_GENERATE",
     # Functions
     "parse_codeowners",
     "validate_codeowners",
+    "validate_codeowners_batch",
+    "compile_check_config",
+    "CompiledCheckConfig",
+    "compile_codeowners",
+    "CompiledCodeowners",
     "generate_codeowners_fixture",
-    # Types (available at runtime)
+    "generate_codeowners_lines",
+    "PatternVocabulary",
+    # Parse result classes
+    "ParseResult",
+    "Ast",
+    "Line",
+    "LineKind",
+    "Pattern",
+    "Owner",
+    "Span",
+    # Types (resolved lazily at runtime)
     "AstDict",
     "CheckConfigDict",
     "GithubClientProtocol",
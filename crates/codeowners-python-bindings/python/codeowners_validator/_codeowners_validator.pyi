@@ -1,9 +1,11 @@
 """Type stubs for the codeowners_validator native module."""
 
-from collections.abc import Awaitable
-from typing import Literal, Protocol, TypedDict
+from collections.abc import Awaitable, Iterator
+from typing import Any, Generic, Literal, Protocol, TypedDict, TypeVar, overload
 
 __version__: str
+HAS_GENERATE: bool
+"""Whether the module was built with the ``generate`` feature (fixture generators)."""
 
 class SpanDict(TypedDict):
     """Location information for a token in the source."""
@@ -58,12 +60,152 @@ class AstDict(TypedDict):
     lines: list[LineDict]
 
 class ParseResultDict(TypedDict):
-    """The result of parsing a CODEOWNERS file."""
+    """The result of parsing a CODEOWNERS file, as plain dicts.
+
+    ``parse_codeowners`` returns a frozen ``ParseResult``; this is the shape
+    of its ``to_dict()`` copy.
+    """
 
     is_ok: bool
     ast: AstDict
     errors: list[str]
 
+_D = TypeVar("_D")
+
+class _FieldMapping(Generic[_D]):
+    """Read-only dict-style access shared by the parse result classes."""
+
+    def get(self, key: str, default: Any = None) -> Any: ...
+    def __contains__(self, key: str) -> bool: ...
+    def __len__(self) -> int: ...
+    def __iter__(self) -> Iterator[str]: ...
+    def keys(self) -> list[str]: ...
+    def values(self) -> list[Any]: ...
+    def items(self) -> list[tuple[str, Any]]: ...
+    def to_dict(self) -> _D:
+        """Convert this object (recursively) into plain dicts and lists."""
+        ...
+
+class Span(_FieldMapping[SpanDict]):
+    """Location information for a token in the source."""
+
+    offset: int
+    line: int
+    column: int
+    length: int
+
+    @overload
+    def __getitem__(self, key: Literal["offset", "line", "column", "length"]) -> int: ...
+    @overload
+    def __getitem__(self, key: str) -> Any: ...
+
+class Owner(_FieldMapping[OwnerDict]):
+    """An owner entry in a CODEOWNERS rule.
+
+    Only the fields belonging to ``type`` are set; the others are ``None``
+    and absent from the mapping keys.
+    """
+
+    type: Literal["user", "team", "email"]
+    name: str | None
+    org: str | None
+    team: str | None
+    email: str | None
+    text: str
+    span: Span
+
+    @overload
+    def __getitem__(self, key: Literal["type"]) -> Literal["user", "team", "email"]: ...
+    @overload
+    def __getitem__(self, key: Literal["name", "org", "team", "email", "text"]) -> str: ...
+    @overload
+    def __getitem__(self, key: Literal["span"]) -> Span: ...
+    @overload
+    def __getitem__(self, key: str) -> Any: ...
+
+class Pattern(_FieldMapping[PatternDict]):
+    """A file pattern in a CODEOWNERS rule."""
+
+    text: str
+    span: Span
+
+    @overload
+    def __getitem__(self, key: Literal["text"]) -> str: ...
+    @overload
+    def __getitem__(self, key: Literal["span"]) -> Span: ...
+    @overload
+    def __getitem__(self, key: str) -> Any: ...
+
+class LineKind(_FieldMapping[LineKindDict]):
+    """The content of a line in a CODEOWNERS file.
+
+    Only the fields belonging to ``type`` are set; the others are ``None``
+    and absent from the mapping keys.
+    """
+
+    type: Literal["blank", "comment", "rule", "invalid"]
+    content: str | None
+    pattern: Pattern | None
+    owners: list[Owner] | None
+    raw: str | None
+    error: str | None
+
+    @overload
+    def __getitem__(self, key: Literal["type"]) -> Literal["blank", "comment", "rule", "invalid"]: ...
+    @overload
+    def __getitem__(self, key: Literal["content", "raw", "error"]) -> str: ...
+    @overload
+    def __getitem__(self, key: Literal["pattern"]) -> Pattern: ...
+    @overload
+    def __getitem__(self, key: Literal["owners"]) -> list[Owner]: ...
+    @overload
+    def __getitem__(self, key: str) -> Any: ...
+
+class Line(_FieldMapping[LineDict]):
+    """A line in a CODEOWNERS file."""
+
+    kind: LineKind
+    span: Span
+
+    @overload
+    def __getitem__(self, key: Literal["kind"]) -> LineKind: ...
+    @overload
+    def __getitem__(self, key: Literal["span"]) -> Span: ...
+    @overload
+    def __getitem__(self, key: str) -> Any: ...
+
+class Ast(_FieldMapping[AstDict]):
+    """The parsed AST of a CODEOWNERS file."""
+
+    lines: list[Line]
+
+    @overload
+    def __getitem__(self, key: Literal["lines"]) -> list[Line]: ...
+    @overload
+    def __getitem__(self, key: str) -> Any: ...
+
+class ParseResult(_FieldMapping[ParseResultDict]):
+    """The frozen result of parsing a CODEOWNERS file.
+
+    Supports read-only dict-style access (``result["ast"]["lines"]``,
+    ``get``, ``in``, ``keys``, ``values``, ``items``) and attribute access
+    (``result.ast.lines``). It is not a ``dict``: use ``to_dict()`` for a
+    plain, mutable copy (e.g. for ``json.dumps`` or comparing against a dict).
+    """
+
+    is_ok: bool
+    ast: Ast
+    errors: list[str]
+
+    @overload
+    def __getitem__(self, key: Literal["is_ok"]) -> bool: ...
+    @overload
+    def __getitem__(self, key: Literal["ast"]) -> Ast: ...
+    @overload
+    def __getitem__(self, key: Literal["errors"]) -> list[str]: ...
+    @overload
+    def __getitem__(self, key: str) -> Any: ...
+
 class IssueDict(TypedDict):
     """A validation issue."""
 
@@ -84,7 +226,7 @@ class ValidationResultDict(TypedDict):
 class CheckConfigDict(TypedDict, total=False):
     """Configuration for validation checks."""
 
-    ignored_owners: list[str]
+    ignored_owners: list[str] | frozenset[str]
     owners_must_be_teams: bool
     allow_unowned_patterns: bool
     skip_patterns: list[str]
@@ -177,18 +319,23 @@ class GithubClientProtocol(Protocol):
         """
         ...
 
-def parse_codeowners(content: str) -> ParseResultDict:
+def parse_codeowners(content: str | bytes) -> ParseResult:
     """Parse a CODEOWNERS file content and return the parsed AST.
 
     Args:
-        content: The CODEOWNERS file content as a string.
+        content: The CODEOWNERS file content, as a string or as UTF-8 encoded
+            bytes (e.g. read from disk in binary mode).
 
     Returns:
-        A dictionary containing:
+        A frozen ``ParseResult`` containing:
         - is_ok: Whether parsing was successful (bool)
-        - ast: The parsed AST containing lines (dict)
+        - ast: The parsed AST containing lines (``Ast``)
         - errors: List of parse errors if any (list)
 
+    Raises:
+        TypeError: If content is neither str nor bytes.
+        UnicodeDecodeError: If bytes content is not valid UTF-8.
+
     Example:
         >>> result = parse_codeowners("*.rs @rustacean\\n/docs/ @docs-team\\n")
         >>> result["is_ok"]
@@ -198,9 +345,90 @@ def parse_codeowners(content: str) -> ParseResultDict:
     """
     ...
 
+class CompiledCheckConfig:
+    """A check configuration converted once from a ``CheckConfigDict``.
+
+    Pass it as ``config`` to ``validate_codeowners`` or
+    ``validate_codeowners_batch`` to reuse the conversion across calls.
+    Instances are immutable.
+    """
+
+def compile_check_config(config: CheckConfigDict) -> CompiledCheckConfig:
+    """Convert a configuration dictionary into a reusable ``CompiledCheckConfig``.
+
+    Args:
+        config: Configuration dictionary (see ``validate_codeowners``).
+
+    Returns:
+        An opaque, immutable configuration accepted as ``config`` by
+        ``validate_codeowners`` and ``validate_codeowners_batch``.
+
+    Example:
+        >>> config = compile_check_config({"ignored_owners": ["@bot"]})
+        >>> result = asyncio.run(validate_codeowners("/path/to/repo", config=config))
+    """
+    ...
+
+class CompiledCodeowners:
+    """A parsed CODEOWNERS file that can be validated repeatedly.
+
+    Created by ``compile_codeowners``. The content is parsed once; each call
+    to ``validate`` runs checks against the stored AST without reading or
+    parsing the CODEOWNERS file again. Instances are immutable.
+    """
+
+    @property
+    def path(self) -> str:
+        """Path reported in issues, relative to the repository root."""
+        ...
+    @property
+    def parse_result(self) -> ParseResult:
+        """The read-only parse result of the content."""
+        ...
+    @property
+    def ast(self) -> Ast:
+        """The parsed AST (same object as ``parse_result["ast"]``)."""
+        ...
+    def validate(
+        self,
+        repo_path: str,
+        config: CheckConfigDict | CompiledCheckConfig | None = None,
+        checks: list[str] | None = None,
+        github_client: GithubClientProtocol | None = None,
+    ) -> Awaitable[ValidationResultDict]:
+        """Validate the compiled CODEOWNERS content against a repository.
+
+        Accepts the same arguments as ``validate_codeowners`` and returns the
+        same result, but skips locating, reading and parsing the file.
+        """
+        ...
+
+def compile_codeowners(content: str | bytes, path: str = ".github/CODEOWNERS") -> CompiledCodeowners:
+    """Parse CODEOWNERS content once for repeated validation.
+
+    Args:
+        content: The CODEOWNERS file content, as a string or as UTF-8 encoded bytes.
+        path: Path of the CODEOWNERS file relative to the repository root,
+            reported in the ``path`` field of issues (default: ".github/CODEOWNERS").
+
+    Returns:
+        A ``CompiledCodeowners`` whose ``validate`` method runs checks against
+        the parsed content.
+
+    Raises:
+        TypeError: If content is neither str nor bytes.
+        UnicodeDecodeError: If bytes content is not valid UTF-8.
+
+    Example:
+        >>> import asyncio
+        >>> compiled = compile_codeowners("*.rs @rustacean\\n")
+        >>> result = asyncio.run(compiled.validate("/path/to/repo", checks=["files"]))
+    """
+    ...
+
 async def validate_codeowners(
     repo_path: str,
-    config: CheckConfigDict | None = None,
+    config: CheckConfigDict | CompiledCheckConfig | None = None,
     checks: list[str] | None = None,
     github_client: GithubClientProtocol | None = None,
 ) -> ValidationResultDict:
@@ -215,8 +443,9 @@ async def validate_codeowners(
     Args:
         repo_path: Path to the repository root directory. The CODEOWNERS file will
             be automatically located within this directory.
-        config: Optional configuration dictionary with keys:
-            - ignored_owners: List of owners to ignore during validation
+        config: Optional configuration dictionary, or a ``CompiledCheckConfig``
+            from ``compile_check_config``. Dictionary keys:
+            - ignored_owners: Owners to ignore during validation (list or frozenset)
             - owners_must_be_teams: Whether owners must be teams (bool)
             - allow_unowned_patterns: Whether to allow patterns without owners (bool)
             - skip_patterns: List of patterns to skip for not-owned check
@@ -261,10 +490,59 @@ async def validate_codeowners(
     """
     ...
 
+async def validate_codeowners_batch(
+    repo_path: str,
+    check_groups: list[list[str]],
+    config: CheckConfigDict | CompiledCheckConfig | None = None,
+    github_client: GithubClientProtocol | None = None,
+) -> list[ValidationResultDict]:
+    """Validate a CODEOWNERS file against several groups of checks at once.
+
+    The CODEOWNERS file is located, read and parsed a single time, and the
+    configuration is converted once; each group of checks then runs against
+    the shared AST. This is equivalent to calling ``validate_codeowners`` once
+    per group, without repeating the parse work.
+
+    Args:
+        repo_path: Path to the repository root directory.
+        check_groups: List of check name lists. Each inner list is run as one
+            validation pass and accepts the same values as the ``checks``
+            argument of ``validate_codeowners``.
+        config: Optional configuration dictionary (see ``validate_codeowners``).
+        github_client: Optional GitHub client object implementing the
+            GithubClientProtocol. Required for the "owners" check.
+
+    Returns:
+        A list with one result dictionary per check group, in the same order
+        as ``check_groups``.
+
+    Raises:
+        FileNotFoundError: If no CODEOWNERS file is found in the repository.
+        IOError: If the CODEOWNERS file cannot be read.
+
+    Example:
+        >>> import asyncio
+        >>> syntax, files = asyncio.run(validate_codeowners_batch(
+        ...     "/path/to/repo",
+        ...     [["syntax"], ["files", "duppatterns"]],
+        ... ))
+    """
+    ...
+
+class PatternVocabulary:
+    """Expanded pattern and owner vocabulary for the fixture generators.
+
+    Building one expands every pattern template up front; pass the same
+    instance as ``vocab`` to several generator calls to only do that once.
+    """
+
+    def __init__(self) -> None: ...
+
 def generate_codeowners_fixture(
     num_rules: int = 100,
     num_comments: int = 20,
     seed: int = 42,
+    vocab: PatternVocabulary | None = None,
 ) -> str:
     """Generate a random CODEOWNERS file for benchmarking.
 
@@ -272,6 +550,8 @@ def generate_codeowners_fixture(
         num_rules: Number of rule lines (default: 100)
         num_comments: Number of comment lines (default: 20)
         seed: Random seed for deterministic generation (default: 42)
+        vocab: Optional ``PatternVocabulary`` to reuse across calls. When
+            omitted, a vocabulary is built for this call and discarded.
 
     Returns:
         A valid CODEOWNERS file content as a string.
@@ -282,3 +562,36 @@ def generate_codeowners_fixture(
         52341
     """
     ...
+
+class CodeownersLineIterator(Iterator[str]):
+    """Iterator over the lines of a generated CODEOWNERS file."""
+
+    def __iter__(self) -> CodeownersLineIterator: ...
+    def __next__(self) -> str: ...
+
+def generate_codeowners_lines(
+    num_rules: int = 100,
+    num_comments: int = 20,
+    seed: int = 42,
+    vocab: PatternVocabulary | None = None,
+) -> CodeownersLineIterator:
+    """Lazily generate the lines of a random CODEOWNERS file for benchmarking.
+
+    Produces the same content as ``generate_codeowners_fixture`` for the same
+    arguments, one line at a time, without building the whole file in memory.
+
+    Args:
+        num_rules: Number of rule lines (default: 100)
+        num_comments: Number of comment lines (default: 20)
+        seed: Random seed for deterministic generation (default: 42)
+        vocab: Optional ``PatternVocabulary`` to reuse across calls.
+
+    Returns:
+        An iterator of lines, each ending with a newline.
+
+    Example:
+        >>> content = "".join(generate_codeowners_lines(num_rules=1000))
+        >>> content == generate_codeowners_fixture(num_rules=1000)
+        True
+    """
+    ...
@@ -67,7 +67,11 @@ class AstDict(TypedDict):
 
 
 class ParseResultDict(TypedDict):
-    """The result of parsing a CODEOWNERS file."""
+    """The result of parsing a CODEOWNERS file, as plain dicts.
+
+    ``parse_codeowners`` returns a frozen ``ParseResult``; this is the shape
+    of its ``to_dict()`` copy.
+    """
 
     is_ok: bool
     ast: AstDict
@@ -95,7 +99,7 @@ class ValidationResultDict(TypedDict):
 class CheckConfigDict(TypedDict, total=False):
     """Configuration for validation checks."""
 
-    ignored_owners: list[str]
+    ignored_owners: list[str] | frozenset[str]
     owners_must_be_teams: bool
     allow_unowned_patterns: bool
     skip_patterns: list[str]
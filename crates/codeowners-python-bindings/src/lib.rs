@@ -2,28 +2,42 @@
 //!
 //! This crate provides Python bindings using PyO3 for the codeowners-validator-core library.
 
+use codeowners_validator_core::parse::{CodeownersFile, ParseResult};
+use codeowners_validator_core::validate::ValidationResult;
+use codeowners_validator_core::validate::checks::CheckConfig;
 use log::{debug, info};
+use pyo3::exceptions::{PyTypeError, PyUnicodeDecodeError};
 use pyo3::prelude::*;
-use pyo3::types::PyDict;
-use std::collections::HashMap;
+use pyo3::types::{PyBytes, PyDict, PyString};
+use std::collections::{HashMap, HashSet};
+use std::path::{Path, PathBuf};
+use std::sync::Arc;
 
 mod github_client;
 mod types;
 
 use github_client::PyGithubClient;
-use types::{PyIssue, PyLine};
+use types::{PyAst, PyIssue, PyLine, PyLineKind, PyOwner, PyParseResult, PyPattern, PySpan};
 
 /// Parse a CODEOWNERS file content and return the parsed AST.
 ///
 /// Args:
-///     content: The CODEOWNERS file content as a string.
+///     content: The CODEOWNERS file content, as a string or as UTF-8 encoded
+///         bytes (e.g. read from disk in binary mode).
 ///
 /// Returns:
-///     A dictionary containing:
+///     A read-only `ParseResult` supporting dict-style access, containing:
 ///     - `is_ok`: Whether parsing was successful (bool)
-///     - `ast`: The parsed AST containing lines (dict)
+///     - `ast`: The parsed AST containing lines
 ///     - `errors`: List of parse errors if any (list)
 ///
+///     Nested objects (`Ast`, `Line`, `LineKind`, `Pattern`, `Owner`, `Span`)
+///     are read-only too; call `to_dict()` on any of them for plain dicts.
+///
+/// Raises:
+///     TypeError: If content is neither str nor bytes.
+///     UnicodeDecodeError: If bytes content is not valid UTF-8.
+///
 /// Example:
 ///     >>> result = parse_codeowners("*.rs @rustacean\\n/docs/ @docs-team\\n")
 ///     >>> result["is_ok"]
@@ -31,7 +45,9 @@ use types::{PyIssue, PyLine};
 ///     >>> len(result["ast"]["lines"])
 ///     2
 #[pyfunction]
-fn parse_codeowners(py: Python<'_>, content: &str) -> PyResult<Py<PyDict>> {
+fn parse_codeowners(py: Python<'_>, content: &Bound<'_, PyAny>) -> PyResult<Py<PyParseResult>> {
+    let content = content_as_str(py, content)?;
+
     debug!(
         "parse_codeowners called with content length: {} bytes",
         content.len()
@@ -45,24 +61,139 @@ fn parse_codeowners(py: Python<'_>, content: &str) -> PyResult<Py<PyDict>> {
         result.errors.len()
     );
 
-    let dict = PyDict::new(py);
-    dict.set_item("is_ok", result.is_ok())?;
+    Py::new(py, PyParseResult::new(py, &result)?)
+}
+
+/// Borrows CODEOWNERS content passed from Python as `str` or UTF-8 `bytes`.
+///
+/// Bytes are borrowed directly from the Python object; no intermediate str is built.
+fn content_as_str<'a>(py: Python<'_>, content: &'a Bound<'_, PyAny>) -> PyResult<&'a str> {
+    if let Ok(bytes) = content.cast::<PyBytes>() {
+        let raw = bytes.as_bytes();
+        std::str::from_utf8(raw).map_err(|e| {
+            match PyUnicodeDecodeError::new_err_from_utf8(py, raw, e) {
+                Ok(err) => PyErr::from_value(err.into_any()),
+                Err(err) => err,
+            }
+        })
+    } else if let Ok(text) = content.cast::<PyString>() {
+        text.to_str()
+    } else {
+        Err(PyTypeError::new_err(format!(
+            "content must be str or bytes, not {}",
+            content.get_type().name()?
+        )))
+    }
+}
+
+/// A parsed CODEOWNERS file that can be validated repeatedly.
+///
+/// Created by `compile_codeowners`. The content is parsed once; each call to
+/// `validate` runs checks against the stored AST without reading or parsing
+/// the CODEOWNERS file again. Instances are immutable.
+#[pyclass(frozen, name = "CompiledCodeowners", module = "codeowners_validator")]
+struct PyCompiledCodeowners {
+    ast: Arc<CodeownersFile>,
+    /// Path reported in issues, relative to the repository root.
+    #[pyo3(get)]
+    path: String,
+    /// The read-only parse result of the content.
+    #[pyo3(get)]
+    parse_result: Py<PyParseResult>,
+}
+
+#[pymethods]
+impl PyCompiledCodeowners {
+    /// The parsed AST (same object as `parse_result.ast`).
+    #[getter]
+    fn ast(&self, py: Python<'_>) -> Py<PyAst> {
+        self.parse_result.get().ast.clone_ref(py)
+    }
+
+    /// Validate the compiled CODEOWNERS content against a repository.
+    ///
+    /// Accepts the same arguments as `validate_codeowners` and returns the
+    /// same result, but skips locating, reading and parsing the file.
+    #[pyo3(signature = (repo_path, config=None, checks=None, github_client=None))]
+    fn validate<'py>(
+        &self,
+        py: Python<'py>,
+        repo_path: &str,
+        config: Option<&Bound<'py, PyAny>>,
+        checks: Option<Vec<String>>,
+        github_client: Option<Bound<'py, PyAny>>,
+    ) -> PyResult<Bound<'py, PyAny>> {
+        info!("CompiledCodeowners.validate called for repo: {}", repo_path);
+
+        let ast = Arc::clone(&self.ast);
+        let relative_path = self.path.clone();
+        let repo_path = repo_path.to_string();
+        let github_client = github_client.map(|c| c.unbind());
+        let check_config = resolve_check_config(config)?;
+
+        pyo3_async_runtimes::tokio::future_into_py(py, async move {
+            let validation_result = run_checks(
+                &ast,
+                Path::new(&repo_path),
+                &check_config,
+                checks,
+                github_client.as_ref(),
+            )
+            .await;
+            Python::attach(|py| validation_result_to_py(py, &validation_result, &relative_path))
+        })
+    }
 
-    // Convert AST
-    let ast_dict = PyDict::new(py);
-    let lines: Vec<PyLine> = result.ast.lines.iter().map(PyLine::from).collect();
-    let py_lines: Vec<Py<PyAny>> = lines
-        .iter()
-        .map(|l| l.to_py(py))
-        .collect::<PyResult<Vec<_>>>()?;
-    ast_dict.set_item("lines", py_lines)?;
-    dict.set_item("ast", ast_dict)?;
+    fn __repr__(&self) -> String {
+        format!(
+            "CompiledCodeowners(path={:?}, lines={})",
+            self.path,
+            self.ast.lines.len()
+        )
+    }
+}
+
+/// Parse CODEOWNERS content once for repeated validation.
+///
+/// Args:
+///     content: The CODEOWNERS file content, as a string or as UTF-8 encoded bytes.
+///     path: Path of the CODEOWNERS file relative to the repository root,
+///         reported in the `path` field of issues (default: ".github/CODEOWNERS").
+///
+/// Returns:
+///     A `CompiledCodeowners` whose `validate` method runs checks against the
+///     parsed content.
+///
+/// Raises:
+///     TypeError: If content is neither str nor bytes.
+///     UnicodeDecodeError: If bytes content is not valid UTF-8.
+///
+/// Example:
+///     >>> import asyncio
+///     >>> compiled = compile_codeowners("*.rs @rustacean\n")
+///     >>> result = asyncio.run(compiled.validate("/path/to/repo", checks=["files"]))
+#[pyfunction]
+#[pyo3(signature = (content, path=".github/CODEOWNERS"))]
+fn compile_codeowners(
+    py: Python<'_>,
+    content: &Bound<'_, PyAny>,
+    path: &str,
+) -> PyResult<PyCompiledCodeowners> {
+    let content = content_as_str(py, content)?;
+    let result = codeowners_validator_core::parse::parse_codeowners(content);
 
-    // Convert errors
-    let errors: Vec<String> = result.errors.iter().map(|e| e.to_string()).collect();
-    dict.set_item("errors", errors)?;
+    debug!(
+        "compile_codeowners: {} lines parsed, {} errors",
+        result.ast.lines.len(),
+        result.errors.len()
+    );
 
-    Ok(dict.into())
+    let parse_result = Py::new(py, PyParseResult::new(py, &result)?)?;
+    Ok(PyCompiledCodeowners {
+        ast: Arc::new(result.ast),
+        path: path.to_string(),
+        parse_result,
+    })
 }
 
 /// Validate a CODEOWNERS file in a repository.
@@ -76,8 +207,9 @@ fn parse_codeowners(py: Python<'_>, content: &str) -> PyResult<Py<PyDict>> {
 /// Args:
 ///     repo_path: Path to the repository root directory. The CODEOWNERS file will
 ///         be automatically located within this directory.
-///     config: Optional configuration dictionary with keys:
-///         - ignored_owners: List of owners to ignore during validation
+///     config: Optional configuration dictionary, or a `CompiledCheckConfig`
+///         from `compile_check_config`. Dictionary keys:
+///         - ignored_owners: Owners to ignore during validation (list or frozenset)
 ///         - owners_must_be_teams: Whether owners must be teams (bool)
 ///         - allow_unowned_patterns: Whether to allow patterns without owners (bool)
 ///         - skip_patterns: List of patterns to skip for not-owned check
@@ -124,7 +256,7 @@ fn parse_codeowners(py: Python<'_>, content: &str) -> PyResult<Py<PyDict>> {
 fn validate_codeowners<'py>(
     py: Python<'py>,
     repo_path: &str,
-    config: Option<&Bound<'py, PyDict>>,
+    config: Option<&Bound<'py, PyAny>>,
     checks: Option<Vec<String>>,
     github_client: Option<Bound<'py, PyAny>>,
 ) -> PyResult<Bound<'py, PyAny>> {
@@ -139,28 +271,181 @@ fn validate_codeowners<'py>(
     // Create the async coroutine
     let repo_path = repo_path.to_string();
     let github_client = github_client.map(|c| c.unbind());
-    let config_dict: Option<HashMap<String, Py<PyAny>>> = config.map(|c| {
-        c.iter()
-            .filter_map(|(k, v)| k.extract::<String>().ok().map(|key| (key, v.unbind())))
-            .collect()
-    });
+    let check_config = resolve_check_config(config)?;
 
     pyo3_async_runtimes::tokio::future_into_py(py, async move {
-        validate_codeowners_impl(&repo_path, config_dict.as_ref(), checks, github_client).await
+        validate_codeowners_impl(&repo_path, &check_config, checks, github_client).await
     })
 }
 
+/// Validate a CODEOWNERS file against several groups of checks at once.
+///
+/// The CODEOWNERS file is located, read and parsed a single time, and the
+/// configuration is converted once; each group of checks then runs against
+/// the shared AST. This is equivalent to calling `validate_codeowners` once
+/// per group, without repeating the parse work.
+///
+/// Args:
+///     repo_path: Path to the repository root directory.
+///     check_groups: List of check name lists. Each inner list is run as one
+///         validation pass and accepts the same values as the `checks`
+///         argument of `validate_codeowners`.
+///     config: Optional configuration dictionary (see `validate_codeowners`).
+///     github_client: Optional GitHub client object implementing the
+///         GithubClientProtocol. Required for the "owners" check.
+///
+/// Returns:
+///     A list with one result dictionary per check group, in the same order
+///     as `check_groups`.
+///
+/// Raises:
+///     FileNotFoundError: If no CODEOWNERS file is found in the repository.
+///     IOError: If the CODEOWNERS file cannot be read.
+///
+/// Example:
+///     >>> import asyncio
+///     >>> syntax, files = asyncio.run(validate_codeowners_batch(
+///     ...     "/path/to/repo",
+///     ...     [["syntax"], ["files", "duppatterns"]],
+///     ... ))
+#[pyfunction]
+#[pyo3(signature = (repo_path, check_groups, config=None, github_client=None))]
+fn validate_codeowners_batch<'py>(
+    py: Python<'py>,
+    repo_path: &str,
+    check_groups: Vec<Vec<String>>,
+    config: Option<&Bound<'py, PyAny>>,
+    github_client: Option<Bound<'py, PyAny>>,
+) -> PyResult<Bound<'py, PyAny>> {
+    info!(
+        "validate_codeowners_batch called for repo: {} ({} check groups)",
+        repo_path,
+        check_groups.len()
+    );
+
+    let repo_path = repo_path.to_string();
+    let github_client = github_client.map(|c| c.unbind());
+    let check_config = resolve_check_config(config)?;
+
+    pyo3_async_runtimes::tokio::future_into_py(py, async move {
+        validate_codeowners_batch_impl(&repo_path, &check_config, check_groups, github_client).await
+    })
+}
+
+/// A check configuration converted once from a `CheckConfigDict`.
+///
+/// Pass it as `config` to `validate_codeowners` or `validate_codeowners_batch`
+/// to reuse the conversion across calls. Instances are immutable.
+#[pyclass(frozen, name = "CompiledCheckConfig", module = "codeowners_validator")]
+struct PyCompiledCheckConfig {
+    config: Arc<CheckConfig>,
+}
+
+#[pymethods]
+impl PyCompiledCheckConfig {
+    fn __repr__(&self) -> String {
+        format!("CompiledCheckConfig({:?})", self.config)
+    }
+}
+
+/// Convert a configuration dictionary into a reusable `CompiledCheckConfig`.
+///
+/// Args:
+///     config: Configuration dictionary (see `validate_codeowners`).
+///
+/// Returns:
+///     An opaque, immutable configuration accepted as `config` by
+///     `validate_codeowners` and `validate_codeowners_batch`.
+///
+/// Example:
+///     >>> config = compile_check_config({"ignored_owners": ["@bot"]})
+///     >>> result = asyncio.run(validate_codeowners("/path/to/repo", config=config))
+#[pyfunction]
+fn compile_check_config(config: &Bound<'_, PyDict>) -> PyCompiledCheckConfig {
+    PyCompiledCheckConfig {
+        config: Arc::new(build_check_config(config)),
+    }
+}
+
+/// Resolves the `config` argument of the validate functions.
+///
+/// Accepts `None`, a configuration dict, or a `CompiledCheckConfig`; the
+/// latter is shared without converting it again.
+fn resolve_check_config(config: Option<&Bound<'_, PyAny>>) -> PyResult<Arc<CheckConfig>> {
+    let Some(config) = config else {
+        return Ok(Arc::new(CheckConfig::new()));
+    };
+    if let Ok(compiled) = config.cast::<PyCompiledCheckConfig>() {
+        Ok(Arc::clone(&compiled.get().config))
+    } else if let Ok(dict) = config.cast::<PyDict>() {
+        Ok(Arc::new(build_check_config(dict)))
+    } else {
+        Err(PyTypeError::new_err(format!(
+            "config must be a dict or CompiledCheckConfig, not {}",
+            config.get_type().name()?
+        )))
+    }
+}
+
 async fn validate_codeowners_impl(
     repo_path: &str,
-    config: Option<&HashMap<String, Py<PyAny>>>,
+    check_config: &CheckConfig,
     checks: Option<Vec<String>>,
     github_client: Option<Py<PyAny>>,
 ) -> PyResult<Py<PyDict>> {
-    use codeowners_validator_core::validate::checks::{CheckRunner, OwnersCheck};
-
     debug!("validate_codeowners_impl starting for: {}", repo_path);
 
-    let repo_path_buf = std::path::Path::new(repo_path);
+    let repo_path_buf = Path::new(repo_path);
+    let (codeowners_path, parse_result) = load_codeowners(repo_path)?;
+
+    let validation_result = run_checks(
+        &parse_result.ast,
+        repo_path_buf,
+        check_config,
+        checks,
+        github_client.as_ref(),
+    )
+    .await;
+
+    let relative_path = relative_codeowners_path(&codeowners_path, repo_path_buf);
+    Python::attach(|py| validation_result_to_py(py, &validation_result, &relative_path))
+}
+
+async fn validate_codeowners_batch_impl(
+    repo_path: &str,
+    check_config: &CheckConfig,
+    check_groups: Vec<Vec<String>>,
+    github_client: Option<Py<PyAny>>,
+) -> PyResult<Vec<Py<PyDict>>> {
+    debug!("validate_codeowners_batch_impl starting for: {}", repo_path);
+
+    let repo_path_buf = Path::new(repo_path);
+    let (codeowners_path, parse_result) = load_codeowners(repo_path)?;
+    let relative_path = relative_codeowners_path(&codeowners_path, repo_path_buf);
+
+    let mut results = Vec::with_capacity(check_groups.len());
+    for checks in check_groups {
+        let validation_result = run_checks(
+            &parse_result.ast,
+            repo_path_buf,
+            check_config,
+            Some(checks),
+            github_client.as_ref(),
+        )
+        .await;
+        results.push(Python::attach(|py| {
+            validation_result_to_py(py, &validation_result, &relative_path)
+        })?);
+    }
+
+    Ok(results)
+}
+
+/// Locates, reads and parses the CODEOWNERS file of a repository.
+///
+/// Returns the path of the CODEOWNERS file along with the parse result.
+fn load_codeowners(repo_path: &str) -> PyResult<(PathBuf, ParseResult)> {
+    let repo_path_buf = Path::new(repo_path);
 
     // Find the CODEOWNERS file
     debug!("Searching for CODEOWNERS file in: {}", repo_path);
@@ -195,40 +480,62 @@ async fn validate_codeowners_impl(
         parse_result.errors.len()
     );
 
-    // Build check config from Python dict
-    let check_config = Python::attach(|py| match config {
-        Some(cfg) => {
-            let mut config = codeowners_validator_core::validate::checks::CheckConfig::new();
+    Ok((codeowners_path, parse_result))
+}
 
-            if let Some(obj) = cfg.get("ignored_owners")
-                && let Ok(list) = obj.bind(py).extract::<Vec<String>>()
-            {
-                config = config.with_ignored_owners(list.into_iter().collect());
-            }
-            if let Some(obj) = cfg.get("owners_must_be_teams")
-                && let Ok(val) = obj.bind(py).extract::<bool>()
-            {
-                config = config.with_owners_must_be_teams(val);
-            }
-            if let Some(obj) = cfg.get("allow_unowned_patterns")
-                && let Ok(val) = obj.bind(py).extract::<bool>()
-            {
-                config = config.with_allow_unowned_patterns(val);
-            }
-            if let Some(obj) = cfg.get("skip_patterns")
-                && let Ok(list) = obj.bind(py).extract::<Vec<String>>()
-            {
-                config = config.with_skip_patterns(list);
-            }
-            if let Some(obj) = cfg.get("repository")
-                && let Ok(val) = obj.bind(py).extract::<String>()
-            {
-                config = config.with_repository(val);
-            }
-            config
-        }
-        None => codeowners_validator_core::validate::checks::CheckConfig::new(),
-    });
+/// Builds a check config from the Python configuration dict.
+///
+/// Keys with values of the wrong type are ignored.
+fn build_check_config(cfg: &Bound<'_, PyDict>) -> CheckConfig {
+    let item = |key: &str| cfg.get_item(key).ok().flatten();
+    let mut config = CheckConfig::new();
+
+    // Sets and frozensets convert directly; lists are collected into a set once
+    if let Some(obj) = item("ignored_owners")
+        && let Ok(owners) = obj
+            .extract::<HashSet<String>>()
+            .or_else(|_| obj.extract::<Vec<String>>().map(HashSet::from_iter))
+    {
+        config = config.with_ignored_owners(owners);
+    }
+    if let Some(obj) = item("owners_must_be_teams")
+        && let Ok(val) = obj.extract::<bool>()
+    {
+        config = config.with_owners_must_be_teams(val);
+    }
+    if let Some(obj) = item("allow_unowned_patterns")
+        && let Ok(val) = obj.extract::<bool>()
+    {
+        config = config.with_allow_unowned_patterns(val);
+    }
+    if let Some(obj) = item("skip_patterns")
+        && let Ok(list) = obj.extract::<Vec<String>>()
+    {
+        config = config.with_skip_patterns(list);
+    }
+    if let Some(obj) = item("repository")
+        && let Ok(val) = obj.extract::<String>()
+    {
+        config = config.with_repository(val);
+    }
+    config
+}
+
+/// Runs the requested checks against a parsed CODEOWNERS file.
+///
+/// When `checks` is `None`, the default checks are run (plus the owners
+/// check if a GitHub client is provided).
+async fn run_checks(
+    ast: &CodeownersFile,
+    repo_path: &Path,
+    check_config: &CheckConfig,
+    checks: Option<Vec<String>>,
+    github_client: Option<&Py<PyAny>>,
+) -> ValidationResult {
+    use codeowners_validator_core::validate::checks::{
+        AvoidShadowingCheck, CheckRunner, DupPatternsCheck, FilesCheck, NotOwnedCheck, OwnersCheck,
+        SyntaxCheck,
+    };
 
     // Determine which checks to run
     let checks_to_run = checks.unwrap_or_else(|| {
@@ -247,10 +554,6 @@ async fn validate_codeowners_impl(
     info!("Running checks: {:?}", checks_to_run);
 
     // Build CheckRunner with requested checks
-    use codeowners_validator_core::validate::checks::{
-        AvoidShadowingCheck, DupPatternsCheck, FilesCheck, NotOwnedCheck, SyntaxCheck,
-    };
-
     let mut runner = CheckRunner::new();
     let mut run_owners = false;
 
@@ -275,25 +578,23 @@ async fn validate_codeowners_impl(
     // Run all checks using CheckRunner
     debug!("Starting check execution (owners check: {})", run_owners);
 
-    let validation_result = if run_owners {
-        debug!("Using GitHub client for owner verification");
-        let py_client =
-            Python::attach(|py| PyGithubClient::new(github_client.as_ref().unwrap().clone_ref(py)));
-        runner
-            .run_all(
-                &parse_result.ast,
-                repo_path_buf,
-                &check_config,
-                Some(
-                    &py_client
-                        as &dyn codeowners_validator_core::validate::github_client::GithubClient,
-                ),
-            )
-            .await
-    } else {
-        runner
-            .run_all(&parse_result.ast, repo_path_buf, &check_config, None)
-            .await
+    let validation_result = match github_client {
+        Some(client) if run_owners => {
+            debug!("Using GitHub client for owner verification");
+            let py_client = Python::attach(|py| PyGithubClient::new(client.clone_ref(py)));
+            runner
+                .run_all(
+                    ast,
+                    repo_path,
+                    check_config,
+                    Some(
+                        &py_client
+                            as &dyn codeowners_validator_core::validate::github_client::GithubClient,
+                    ),
+                )
+                .await
+        }
+        _ => runner.run_all(ast, repo_path, check_config, None).await,
     };
 
     info!(
@@ -301,107 +602,102 @@ async fn validate_codeowners_impl(
         validation_result.errors.len()
     );
 
-    // Convert results to Python dict
-    // Group errors by check name based on the error type
-    Python::attach(|py| {
-        let result_dict = PyDict::new(py);
-
-        // Initialize empty lists for all possible checks
-        for check_name in &[
-            "syntax",
-            "files",
-            "duppatterns",
-            "owners",
-            "notowned",
-            "avoid-shadowing",
-        ] {
-            let empty_list: Vec<HashMap<String, Py<PyAny>>> = vec![];
-            result_dict.set_item(*check_name, empty_list)?;
-        }
+    validation_result
+}
 
-        // Group errors by their source check
-        use codeowners_validator_core::validate::ValidationError;
-
-        let mut syntax_errors = Vec::new();
-        let mut files_errors = Vec::new();
-        let mut duppatterns_errors = Vec::new();
-        let mut owners_errors = Vec::new();
-        let mut notowned_errors = Vec::new();
-        let mut shadowing_errors = Vec::new();
-
-        for error in &validation_result.errors {
-            match error {
-                ValidationError::InvalidPatternSyntax { .. }
-                | ValidationError::InvalidOwnerFormat { .. }
-                | ValidationError::UnsupportedPatternSyntax { .. } => {
-                    syntax_errors.push(error);
-                }
-                ValidationError::PatternNotMatching { .. } => {
-                    files_errors.push(error);
-                }
-                ValidationError::DuplicatePattern { .. } => {
-                    duppatterns_errors.push(error);
-                }
-                ValidationError::OwnerNotFound { .. }
-                | ValidationError::InsufficientAuthorization { .. }
-                | ValidationError::OwnerMustBeTeam { .. } => {
-                    owners_errors.push(error);
-                }
-                ValidationError::FileNotOwned { .. } => {
-                    notowned_errors.push(error);
-                }
-                ValidationError::PatternShadowed { .. } => {
-                    shadowing_errors.push(error);
-                }
+/// Returns the CODEOWNERS path relative to the repository root.
+fn relative_codeowners_path(codeowners_path: &Path, repo_path: &Path) -> String {
+    codeowners_path
+        .strip_prefix(repo_path)
+        .unwrap_or(codeowners_path)
+        .to_string_lossy()
+        .to_string()
+}
+
+/// Converts validation results to a Python dict grouped by check name.
+fn validation_result_to_py(
+    py: Python<'_>,
+    validation_result: &ValidationResult,
+    relative_path: &str,
+) -> PyResult<Py<PyDict>> {
+    use codeowners_validator_core::validate::ValidationError;
+
+    let result_dict = PyDict::new(py);
+
+    // Initialize empty lists for all possible checks
+    for check_name in &[
+        "syntax",
+        "files",
+        "duppatterns",
+        "owners",
+        "notowned",
+        "avoid-shadowing",
+    ] {
+        let empty_list: Vec<HashMap<String, Py<PyAny>>> = vec![];
+        result_dict.set_item(*check_name, empty_list)?;
+    }
+
+    // Group errors by their source check
+    let mut syntax_errors = Vec::new();
+    let mut files_errors = Vec::new();
+    let mut duppatterns_errors = Vec::new();
+    let mut owners_errors = Vec::new();
+    let mut notowned_errors = Vec::new();
+    let mut shadowing_errors = Vec::new();
+
+    for error in &validation_result.errors {
+        match error {
+            ValidationError::InvalidPatternSyntax { .. }
+            | ValidationError::InvalidOwnerFormat { .. }
+            | ValidationError::UnsupportedPatternSyntax { .. } => {
+                syntax_errors.push(error);
+            }
+            ValidationError::PatternNotMatching { .. } => {
+                files_errors.push(error);
+            }
+            ValidationError::DuplicatePattern { .. } => {
+                duppatterns_errors.push(error);
+            }
+            ValidationError::OwnerNotFound { .. }
+            | ValidationError::InsufficientAuthorization { .. }
+            | ValidationError::OwnerMustBeTeam { .. } => {
+                owners_errors.push(error);
+            }
+            ValidationError::FileNotOwned { .. } => {
+                notowned_errors.push(error);
+            }
+            ValidationError::PatternShadowed { .. } => {
+                shadowing_errors.push(error);
             }
         }
+    }
 
-        debug!(
-            "Issues by category - syntax: {}, files: {}, duppatterns: {}, owners: {}, notowned: {}, shadowing: {}",
-            syntax_errors.len(),
-            files_errors.len(),
-            duppatterns_errors.len(),
-            owners_errors.len(),
-            notowned_errors.len(),
-            shadowing_errors.len()
-        );
-
-        // Calculate the relative path of the CODEOWNERS file to the repo root
-        let relative_path = codeowners_path
-            .strip_prefix(repo_path_buf)
-            .unwrap_or(&codeowners_path)
-            .to_string_lossy()
-            .to_string();
-
-        // Convert each group to Python
-        let convert_errors = |errors: Vec<&ValidationError>,
-                              py: Python<'_>,
-                              path: &str|
-         -> PyResult<Vec<Py<PyAny>>> {
-            errors
-                .iter()
-                .map(|e| PyIssue::new(e, path.to_string()).to_py(py))
-                .collect()
-        };
+    debug!(
+        "Issues by category - syntax: {}, files: {}, duppatterns: {}, owners: {}, notowned: {}, shadowing: {}",
+        syntax_errors.len(),
+        files_errors.len(),
+        duppatterns_errors.len(),
+        owners_errors.len(),
+        notowned_errors.len(),
+        shadowing_errors.len()
+    );
 
-        result_dict.set_item("syntax", convert_errors(syntax_errors, py, &relative_path)?)?;
-        result_dict.set_item("files", convert_errors(files_errors, py, &relative_path)?)?;
-        result_dict.set_item(
-            "duppatterns",
-            convert_errors(duppatterns_errors, py, &relative_path)?,
-        )?;
-        result_dict.set_item("owners", convert_errors(owners_errors, py, &relative_path)?)?;
-        result_dict.set_item(
-            "notowned",
-            convert_errors(notowned_errors, py, &relative_path)?,
-        )?;
-        result_dict.set_item(
-            "avoid-shadowing",
-            convert_errors(shadowing_errors, py, &relative_path)?,
-        )?;
-
-        Ok(result_dict.into())
-    })
+    // Convert each group to Python
+    let convert_errors = |errors: Vec<&ValidationError>| -> PyResult<Vec<Py<PyAny>>> {
+        errors
+            .iter()
+            .map(|e| PyIssue::new(e, relative_path.to_string()).to_py(py))
+            .collect()
+    };
+
+    result_dict.set_item("syntax", convert_errors(syntax_errors)?)?;
+    result_dict.set_item("files", convert_errors(files_errors)?)?;
+    result_dict.set_item("duppatterns", convert_errors(duppatterns_errors)?)?;
+    result_dict.set_item("owners", convert_errors(owners_errors)?)?;
+    result_dict.set_item("notowned", convert_errors(notowned_errors)?)?;
+    result_dict.set_item("avoid-shadowing", convert_errors(shadowing_errors)?)?;
+
+    Ok(result_dict.into())
 }
 
 /// Generate a random CODEOWNERS file for benchmarking.
@@ -410,6 +706,8 @@ async fn validate_codeowners_impl(
 ///     num_rules: Number of rule lines (default: 100)
 ///     num_comments: Number of comment lines (default: 20)
 ///     seed: Random seed for deterministic generation (default: 42)
+///     vocab: Optional `PatternVocabulary` to reuse across calls. When omitted,
+///         a vocabulary is built for this call and discarded.
 ///
 /// Returns:
 ///     A valid CODEOWNERS file content as a string.
@@ -420,9 +718,14 @@ async fn validate_codeowners_impl(
 ///     52341
 #[cfg(feature = "generate")]
 #[pyfunction]
-#[pyo3(signature = (num_rules=100, num_comments=20, seed=42))]
-fn generate_codeowners_fixture(num_rules: usize, num_comments: usize, seed: u64) -> String {
-    use codeowners_validator_core::generate::{GeneratorConfig, generate};
+#[pyo3(signature = (num_rules=100, num_comments=20, seed=42, vocab=None))]
+fn generate_codeowners_fixture(
+    num_rules: usize,
+    num_comments: usize,
+    seed: u64,
+    vocab: Option<&Bound<'_, PyPatternVocabulary>>,
+) -> String {
+    use codeowners_validator_core::generate::{GeneratorConfig, generate_with_vocabulary};
 
     let config = GeneratorConfig {
         num_rules,
@@ -430,7 +733,103 @@ fn generate_codeowners_fixture(num_rules: usize, num_comments: usize, seed: u64)
         seed,
         ..GeneratorConfig::default()
     };
-    generate(&config)
+    generate_with_vocabulary(&config, PyPatternVocabulary::resolve(vocab))
+}
+
+/// Expanded pattern and owner vocabulary for the fixture generators.
+///
+/// Building one expands every pattern template up front; pass the same
+/// instance as `vocab` to several generator calls to only do that once.
+#[cfg(feature = "generate")]
+#[pyclass(frozen, name = "PatternVocabulary", module = "codeowners_validator")]
+struct PyPatternVocabulary {
+    vocab: Arc<codeowners_validator_core::generate::PatternVocabulary>,
+}
+
+#[cfg(feature = "generate")]
+#[pymethods]
+impl PyPatternVocabulary {
+    #[new]
+    fn new() -> Self {
+        Self {
+            vocab: Arc::default(),
+        }
+    }
+}
+
+#[cfg(feature = "generate")]
+impl PyPatternVocabulary {
+    /// Returns the shared vocabulary, or builds a fresh one when none is given.
+    fn resolve(
+        vocab: Option<&Bound<'_, Self>>,
+    ) -> Arc<codeowners_validator_core::generate::PatternVocabulary> {
+        vocab.map_or_else(Arc::default, |v| Arc::clone(&v.get().vocab))
+    }
+}
+
+/// Iterator over the lines of a generated CODEOWNERS file.
+///
+/// Lines are generated on demand and yielded with their trailing newline,
+/// like iterating over a file object.
+#[cfg(feature = "generate")]
+#[pyclass(name = "CodeownersLineIterator", module = "codeowners_validator")]
+struct PyCodeownersLineIterator {
+    lines: Box<dyn Iterator<Item = codeowners_validator_core::parse::Line> + Send + Sync>,
+}
+
+#[cfg(feature = "generate")]
+#[pymethods]
+impl PyCodeownersLineIterator {
+    fn __iter__(slf: PyRef<'_, Self>) -> PyRef<'_, Self> {
+        slf
+    }
+
+    fn __next__(mut slf: PyRefMut<'_, Self>) -> Option<String> {
+        slf.lines.next().map(|line| format!("{}\n", line))
+    }
+}
+
+/// Lazily generate the lines of a random CODEOWNERS file for benchmarking.
+///
+/// Produces the same content as `generate_codeowners_fixture` for the same
+/// arguments, one line at a time, without building the whole file in memory.
+///
+/// Args:
+///     num_rules: Number of rule lines (default: 100)
+///     num_comments: Number of comment lines (default: 20)
+///     seed: Random seed for deterministic generation (default: 42)
+///     vocab: Optional `PatternVocabulary` to reuse across calls.
+///
+/// Returns:
+///     An iterator of lines, each ending with a newline.
+///
+/// Example:
+///     >>> content = "".join(generate_codeowners_lines(num_rules=1000))
+///     >>> content == generate_codeowners_fixture(num_rules=1000)
+///     True
+#[cfg(feature = "generate")]
+#[pyfunction]
+#[pyo3(signature = (num_rules=100, num_comments=20, seed=42, vocab=None))]
+fn generate_codeowners_lines(
+    num_rules: usize,
+    num_comments: usize,
+    seed: u64,
+    vocab: Option<&Bound<'_, PyPatternVocabulary>>,
+) -> PyCodeownersLineIterator {
+    use codeowners_validator_core::generate::{GeneratorConfig, generate_lines_with_vocabulary};
+
+    let config = GeneratorConfig {
+        num_rules,
+        num_comments,
+        seed,
+        ..GeneratorConfig::default()
+    };
+    PyCodeownersLineIterator {
+        lines: Box::new(generate_lines_with_vocabulary(
+            &config,
+            PyPatternVocabulary::resolve(vocab),
+        )),
+    }
 }
 
 /// The Python module for codeowners_validator.
@@ -442,12 +841,32 @@ fn _codeowners_validator(m: &Bound<'_, PyModule>) -> PyResult<()> {
 
     m.add_function(wrap_pyfunction!(parse_codeowners, m)?)?;
     m.add_function(wrap_pyfunction!(validate_codeowners, m)?)?;
+    m.add_function(wrap_pyfunction!(validate_codeowners_batch, m)?)?;
+    m.add_function(wrap_pyfunction!(compile_check_config, m)?)?;
+    m.add_function(wrap_pyfunction!(compile_codeowners, m)?)?;
+    m.add_class::<PyCompiledCheckConfig>()?;
+    m.add_class::<PyCompiledCodeowners>()?;
+
+    // Parse result classes
+    m.add_class::<PyParseResult>()?;
+    m.add_class::<PyAst>()?;
+    m.add_class::<PyLine>()?;
+    m.add_class::<PyLineKind>()?;
+    m.add_class::<PyPattern>()?;
+    m.add_class::<PyOwner>()?;
+    m.add_class::<PySpan>()?;
 
     #[cfg(feature = "generate")]
-    m.add_function(wrap_pyfunction!(generate_codeowners_fixture, m)?)?;
+    {
+        m.add_function(wrap_pyfunction!(generate_codeowners_fixture, m)?)?;
+        m.add_function(wrap_pyfunction!(generate_codeowners_lines, m)?)?;
+        m.add_class::<PyCodeownersLineIterator>()?;
+        m.add_class::<PyPatternVocabulary>()?;
+    }
 
-    // Add version info
+    // Add version and build feature info
     m.add("__version__", env!("CARGO_PKG_VERSION"))?;
+    m.add("HAS_GENERATE", cfg!(feature = "generate"))?;
 
     Ok(())
 }
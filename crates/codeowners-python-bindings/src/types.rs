@@ -1,17 +1,159 @@
 //! Python wrapper types for the CODEOWNERS validator.
 
-use codeowners_validator_core::parse::{Line, LineKind, Owner, Pattern, Span};
+use codeowners_validator_core::parse::{Line, LineKind, Owner, ParseResult, Pattern, Span};
 use codeowners_validator_core::validate::{Severity, ValidationError};
+use pyo3::exceptions::PyKeyError;
+use pyo3::intern;
 use pyo3::prelude::*;
+use pyo3::pyclass::boolean_struct::True;
+use pyo3::types::{PyDict, PyIterator, PyList, PyString};
+use pyo3::{IntoPyObjectExt, PyClass};
 use pythonize::pythonize;
-use serde::Serialize;
+use serde::{Serialize, Serializer};
+use std::convert::Infallible;
+
+/// Dict-style read access for the frozen parse result classes.
+///
+/// Parse results used to be returned as nested dicts. The classes below keep
+/// that read API (`obj["key"]`, `get`, `in`, `keys`, ...) on top of compact
+/// frozen objects, via [`mapping_protocol!`].
+pub trait FieldMapping {
+    /// Returns the keys present on this object, in dict order.
+    fn field_keys(&self) -> Vec<&'static str>;
+
+    /// Returns the value for `key`, or `None` if the key is absent.
+    fn field<'py>(&self, py: Python<'py>, key: &str) -> PyResult<Option<Bound<'py, PyAny>>>;
+}
+
+/// Converts a field value into a Python object for [`FieldMapping::field`].
+fn some_py<'py, T: IntoPyObject<'py>>(
+    py: Python<'py>,
+    value: T,
+) -> PyResult<Option<Bound<'py, PyAny>>> {
+    value.into_bound_py_any(py).map(Some)
+}
+
+/// Implements the read-only mapping protocol for [`FieldMapping`] classes.
+macro_rules! mapping_protocol {
+    ($($ty:ty),* $(,)?) => {$(
+        #[pymethods]
+        impl $ty {
+            fn __getitem__<'py>(&self, py: Python<'py>, key: &str) -> PyResult<Bound<'py, PyAny>> {
+                self.field(py, key)?
+                    .ok_or_else(|| PyKeyError::new_err(key.to_string()))
+            }
+
+            #[pyo3(signature = (key, default=None))]
+            fn get<'py>(
+                &self,
+                py: Python<'py>,
+                key: &str,
+                default: Option<Bound<'py, PyAny>>,
+            ) -> PyResult<Option<Bound<'py, PyAny>>> {
+                Ok(self.field(py, key)?.or(default))
+            }
+
+            fn __contains__(&self, key: &Bound<'_, PyAny>) -> bool {
+                // Like dict, a non-str key is simply absent rather than an error
+                key.cast::<PyString>()
+                    .ok()
+                    .and_then(|key| key.to_cow().ok())
+                    .is_some_and(|key| self.field_keys().iter().any(|k| *k == key))
+            }
+
+            fn __len__(&self) -> usize {
+                self.field_keys().len()
+            }
+
+            fn __iter__<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyIterator>> {
+                PyList::new(py, self.field_keys())?.try_iter()
+            }
+
+            fn keys(&self) -> Vec<&'static str> {
+                self.field_keys()
+            }
+
+            fn values<'py>(&self, py: Python<'py>) -> PyResult<Vec<Bound<'py, PyAny>>> {
+                self.field_keys()
+                    .into_iter()
+                    .filter_map(|key| self.field(py, key).transpose())
+                    .collect()
+            }
+
+            fn items<'py>(
+                &self,
+                py: Python<'py>,
+            ) -> PyResult<Vec<(&'static str, Bound<'py, PyAny>)>> {
+                self.field_keys()
+                    .into_iter()
+                    .filter_map(|key| {
+                        self.field(py, key)
+                            .map(|value| value.map(|value| (key, value)))
+                            .transpose()
+                    })
+                    .collect()
+            }
+
+            /// Converts this object (recursively) into plain dicts and lists.
+            fn to_dict<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyAny>> {
+                pythonize(py, self)
+                    .map_err(|e| pyo3::exceptions::PyValueError::new_err(e.to_string()))
+            }
+
+            fn __repr__(slf: &Bound<'_, Self>) -> PyResult<String> {
+                let dict = slf.get().to_dict(slf.py())?;
+                Ok(format!("{}({})", slf.get_type().name()?, dict.repr()?))
+            }
+        }
+    )*};
+}
+
+/// Discriminator exposed to Python as the `type` of owners and line kinds.
+///
+/// Converts to an interned Python string, so the thousands of owners and
+/// lines in a large file share one `str` object per tag value.
+#[derive(Debug, Clone, Copy, PartialEq, Eq, Serialize)]
+#[serde(rename_all = "lowercase")]
+pub enum Tag {
+    User,
+    Team,
+    Email,
+    Blank,
+    Comment,
+    Rule,
+    Invalid,
+}
+
+impl<'py> IntoPyObject<'py> for Tag {
+    type Target = PyString;
+    type Output = Bound<'py, PyString>;
+    type Error = Infallible;
+
+    fn into_pyobject(self, py: Python<'py>) -> Result<Self::Output, Self::Error> {
+        let tag = match self {
+            Tag::User => intern!(py, "user"),
+            Tag::Team => intern!(py, "team"),
+            Tag::Email => intern!(py, "email"),
+            Tag::Blank => intern!(py, "blank"),
+            Tag::Comment => intern!(py, "comment"),
+            Tag::Rule => intern!(py, "rule"),
+            Tag::Invalid => intern!(py, "invalid"),
+        };
+        Ok(tag.clone())
+    }
+}
 
 /// Python wrapper for Span.
-#[derive(Debug, Clone, Serialize)]
+#[pyclass(frozen, eq, name = "Span", module = "codeowners_validator")]
+#[derive(Debug, Clone, PartialEq, Eq, Serialize)]
 pub struct PySpan {
+    #[pyo3(get)]
     pub offset: usize,
+    #[pyo3(get)]
     pub line: usize,
+    #[pyo3(get)]
     pub column: usize,
+    #[pyo3(get)]
     pub length: usize,
 }
 
@@ -26,129 +168,539 @@ impl From<&Span> for PySpan {
     }
 }
 
+impl FieldMapping for PySpan {
+    fn field_keys(&self) -> Vec<&'static str> {
+        vec!["offset", "line", "column", "length"]
+    }
+
+    fn field<'py>(&self, py: Python<'py>, key: &str) -> PyResult<Option<Bound<'py, PyAny>>> {
+        match key {
+            "offset" => some_py(py, self.offset),
+            "line" => some_py(py, self.line),
+            "column" => some_py(py, self.column),
+            "length" => some_py(py, self.length),
+            _ => Ok(None),
+        }
+    }
+}
+
+/// A Python `str` created once and handed out on every read.
+///
+/// Used for the string fields of the parse result classes, so that repeated
+/// access (`owner["name"]`, `pattern.text`, ...) returns the same object
+/// instead of building a new `str` each time.
+#[derive(Debug)]
+pub struct SharedStr(Py<PyString>);
+
+impl SharedStr {
+    pub fn new(py: Python<'_>, value: &str) -> Self {
+        Self(PyString::new(py, value).unbind())
+    }
+}
+
+impl<'py> IntoPyObject<'py> for &SharedStr {
+    type Target = PyString;
+    type Output = Bound<'py, PyString>;
+    type Error = Infallible;
+
+    fn into_pyobject(self, py: Python<'py>) -> Result<Self::Output, Self::Error> {
+        Ok(self.0.bind(py).clone())
+    }
+}
+
+impl PartialEq for SharedStr {
+    fn eq(&self, other: &Self) -> bool {
+        Python::attach(|py| self.0.bind(py).to_cow().ok() == other.0.bind(py).to_cow().ok())
+    }
+}
+
+impl Eq for SharedStr {}
+
+impl Serialize for SharedStr {
+    fn serialize<S: Serializer>(&self, serializer: S) -> Result<S::Ok, S::Error> {
+        Python::attach(|py| {
+            let value = self
+                .0
+                .bind(py)
+                .to_cow()
+                .map_err(serde::ser::Error::custom)?;
+            serializer.serialize_str(&value)
+        })
+    }
+}
+
+/// Serializes a stored Python object through its Rust value.
+fn serialize_py<T, S>(value: &Py<T>, serializer: S) -> Result<S::Ok, S::Error>
+where
+    T: PyClass<Frozen = True> + Sync + Serialize,
+    S: Serializer,
+{
+    value.get().serialize(serializer)
+}
+
+/// Serializes a sequence of stored Python objects through their Rust values.
+fn serialize_py_seq<T, S>(values: &[Py<T>], serializer: S) -> Result<S::Ok, S::Error>
+where
+    T: PyClass<Frozen = True> + Sync + Serialize,
+    S: Serializer,
+{
+    serializer.collect_seq(values.iter().map(Py::get))
+}
+
+/// Like [`serialize_py`], for optional fields (`None` is skipped by serde).
+fn serialize_opt_py<T, S>(value: &Option<Py<T>>, serializer: S) -> Result<S::Ok, S::Error>
+where
+    T: PyClass<Frozen = True> + Sync + Serialize,
+    S: Serializer,
+{
+    match value {
+        Some(value) => serialize_py(value, serializer),
+        None => serializer.serialize_none(),
+    }
+}
+
+/// Like [`serialize_py_seq`], for optional fields (`None` is skipped by serde).
+fn serialize_opt_py_seq<T, S>(values: &Option<Vec<Py<T>>>, serializer: S) -> Result<S::Ok, S::Error>
+where
+    T: PyClass<Frozen = True> + Sync + Serialize,
+    S: Serializer,
+{
+    match values {
+        Some(values) => serialize_py_seq(values, serializer),
+        None => serializer.serialize_none(),
+    }
+}
+
+/// Compares two stored Python objects by their Rust values.
+fn py_eq<T>(a: &Py<T>, b: &Py<T>) -> bool
+where
+    T: PyClass<Frozen = True> + Sync + PartialEq,
+{
+    a.get() == b.get()
+}
+
+/// Compares two sequences of stored Python objects by their Rust values.
+fn py_seq_eq<T>(a: &[Py<T>], b: &[Py<T>]) -> bool
+where
+    T: PyClass<Frozen = True> + Sync + PartialEq,
+{
+    a.len() == b.len() && a.iter().zip(b).all(|(a, b)| py_eq(a, b))
+}
+
 /// Python wrapper for Owner.
-#[derive(Debug, Clone, Serialize)]
-#[serde(tag = "type", rename_all = "lowercase")]
-pub enum PyOwner {
-    User {
-        name: String,
-        text: String,
-        span: PySpan,
-    },
-    Team {
-        org: String,
-        team: String,
-        text: String,
-        span: PySpan,
-    },
-    Email {
-        email: String,
-        text: String,
-        span: PySpan,
-    },
-}
-
-impl From<&Owner> for PyOwner {
-    fn from(owner: &Owner) -> Self {
-        match owner {
-            Owner::User { name, span } => PyOwner::User {
-                name: name.clone(),
-                text: format!("@{}", name),
-                span: PySpan::from(span),
+///
+/// `type` is one of "user", "team" or "email"; only the fields belonging to
+/// that type (`name`, `org`/`team`, `email`) are set.
+#[pyclass(frozen, eq, name = "Owner", module = "codeowners_validator")]
+#[derive(Debug, Serialize)]
+pub struct PyOwner {
+    #[pyo3(get, name = "type")]
+    #[serde(rename = "type")]
+    pub kind: Tag,
+    #[pyo3(get)]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub name: Option<SharedStr>,
+    #[pyo3(get)]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub org: Option<SharedStr>,
+    #[pyo3(get)]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub team: Option<SharedStr>,
+    #[pyo3(get)]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub email: Option<SharedStr>,
+    #[pyo3(get)]
+    pub text: SharedStr,
+    #[pyo3(get)]
+    #[serde(serialize_with = "serialize_py")]
+    pub span: Py<PySpan>,
+}
+
+impl PyOwner {
+    /// Builds the Python owner (and its span object) from a core owner.
+    pub fn new(py: Python<'_>, owner: &Owner) -> PyResult<Self> {
+        let base = |kind: Tag, text: &str, span: &Span| -> PyResult<PyOwner> {
+            Ok(PyOwner {
+                kind,
+                name: None,
+                org: None,
+                team: None,
+                email: None,
+                text: SharedStr::new(py, text),
+                span: Py::new(py, PySpan::from(span))?,
+            })
+        };
+        Ok(match owner {
+            Owner::User { name, span } => PyOwner {
+                name: Some(SharedStr::new(py, name)),
+                ..base(Tag::User, &format!("@{}", name), span)?
             },
-            Owner::Team { org, team, span } => PyOwner::Team {
-                org: org.clone(),
-                team: team.clone(),
-                text: format!("@{}/{}", org, team),
-                span: PySpan::from(span),
+            Owner::Team { org, team, span } => PyOwner {
+                org: Some(SharedStr::new(py, org)),
+                team: Some(SharedStr::new(py, team)),
+                ..base(Tag::Team, &format!("@{}/{}", org, team), span)?
             },
-            Owner::Email { email, span } => PyOwner::Email {
-                email: email.clone(),
-                text: email.clone(),
-                span: PySpan::from(span),
+            Owner::Email { email, span } => PyOwner {
+                email: Some(SharedStr::new(py, email)),
+                ..base(Tag::Email, email, span)?
             },
+        })
+    }
+}
+
+impl PartialEq for PyOwner {
+    fn eq(&self, other: &Self) -> bool {
+        self.kind == other.kind
+            && self.name == other.name
+            && self.org == other.org
+            && self.team == other.team
+            && self.email == other.email
+            && self.text == other.text
+            && py_eq(&self.span, &other.span)
+    }
+}
+
+impl FieldMapping for PyOwner {
+    fn field_keys(&self) -> Vec<&'static str> {
+        let mut keys = vec!["type"];
+        for (key, value) in [
+            ("name", &self.name),
+            ("org", &self.org),
+            ("team", &self.team),
+            ("email", &self.email),
+        ] {
+            if value.is_some() {
+                keys.push(key);
+            }
+        }
+        keys.extend(["text", "span"]);
+        keys
+    }
+
+    fn field<'py>(&self, py: Python<'py>, key: &str) -> PyResult<Option<Bound<'py, PyAny>>> {
+        let optional = |value: &Option<SharedStr>| match value {
+            Some(value) => some_py(py, value),
+            None => Ok(None),
+        };
+        match key {
+            "type" => some_py(py, self.kind),
+            "name" => optional(&self.name),
+            "org" => optional(&self.org),
+            "team" => optional(&self.team),
+            "email" => optional(&self.email),
+            "text" => some_py(py, &self.text),
+            "span" => some_py(py, &self.span),
+            _ => Ok(None),
         }
     }
 }
 
 /// Python wrapper for Pattern.
-#[derive(Debug, Clone, Serialize)]
+#[pyclass(frozen, eq, name = "Pattern", module = "codeowners_validator")]
+#[derive(Debug, Serialize)]
 pub struct PyPattern {
-    pub text: String,
-    pub span: PySpan,
+    #[pyo3(get)]
+    pub text: SharedStr,
+    #[pyo3(get)]
+    #[serde(serialize_with = "serialize_py")]
+    pub span: Py<PySpan>,
 }
 
-impl From<&Pattern> for PyPattern {
-    fn from(pattern: &Pattern) -> Self {
-        Self {
-            text: pattern.text.clone(),
-            span: PySpan::from(&pattern.span),
+impl PyPattern {
+    /// Builds the Python pattern (and its span object) from a core pattern.
+    pub fn new(py: Python<'_>, pattern: &Pattern) -> PyResult<Self> {
+        Ok(Self {
+            text: SharedStr::new(py, &pattern.text),
+            span: Py::new(py, PySpan::from(&pattern.span))?,
+        })
+    }
+}
+
+impl PartialEq for PyPattern {
+    fn eq(&self, other: &Self) -> bool {
+        self.text == other.text && py_eq(&self.span, &other.span)
+    }
+}
+
+impl FieldMapping for PyPattern {
+    fn field_keys(&self) -> Vec<&'static str> {
+        vec!["text", "span"]
+    }
+
+    fn field<'py>(&self, py: Python<'py>, key: &str) -> PyResult<Option<Bound<'py, PyAny>>> {
+        match key {
+            "text" => some_py(py, &self.text),
+            "span" => some_py(py, &self.span),
+            _ => Ok(None),
         }
     }
 }
 
 /// Python wrapper for LineKind.
-#[derive(Debug, Clone, Serialize)]
-#[serde(tag = "type", rename_all = "lowercase")]
-pub enum PyLineKind {
-    Blank,
-    Comment {
-        content: String,
-    },
-    Rule {
-        pattern: PyPattern,
-        owners: Vec<PyOwner>,
-    },
-    Invalid {
-        raw: String,
-        error: String,
-    },
-}
-
-impl From<&LineKind> for PyLineKind {
-    fn from(kind: &LineKind) -> Self {
-        match kind {
-            LineKind::Blank => PyLineKind::Blank,
-            LineKind::Comment { content } => PyLineKind::Comment {
-                content: content.clone(),
+///
+/// `type` is one of "blank", "comment", "rule" or "invalid"; only the fields
+/// belonging to that type (`content`, `pattern`/`owners`, `raw`/`error`)
+/// are set.
+#[pyclass(frozen, eq, name = "LineKind", module = "codeowners_validator")]
+#[derive(Debug, Serialize)]
+pub struct PyLineKind {
+    #[pyo3(get, name = "type")]
+    #[serde(rename = "type")]
+    pub kind: Tag,
+    #[pyo3(get)]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub content: Option<SharedStr>,
+    #[pyo3(get)]
+    #[serde(
+        skip_serializing_if = "Option::is_none",
+        serialize_with = "serialize_opt_py"
+    )]
+    pub pattern: Option<Py<PyPattern>>,
+    #[pyo3(get)]
+    #[serde(
+        skip_serializing_if = "Option::is_none",
+        serialize_with = "serialize_opt_py_seq"
+    )]
+    pub owners: Option<Vec<Py<PyOwner>>>,
+    #[pyo3(get)]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub raw: Option<SharedStr>,
+    #[pyo3(get)]
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub error: Option<SharedStr>,
+}
+
+impl PyLineKind {
+    fn empty(kind: Tag) -> Self {
+        Self {
+            kind,
+            content: None,
+            pattern: None,
+            owners: None,
+            raw: None,
+            error: None,
+        }
+    }
+
+    /// Builds the Python line kind (and its nested objects) from a core line kind.
+    pub fn new(py: Python<'_>, kind: &LineKind) -> PyResult<Self> {
+        Ok(match kind {
+            LineKind::Blank => PyLineKind::empty(Tag::Blank),
+            LineKind::Comment { content } => PyLineKind {
+                content: Some(SharedStr::new(py, content)),
+                ..PyLineKind::empty(Tag::Comment)
             },
-            LineKind::Rule { pattern, owners } => PyLineKind::Rule {
-                pattern: PyPattern::from(pattern),
-                owners: owners.iter().map(PyOwner::from).collect(),
+            LineKind::Rule { pattern, owners } => PyLineKind {
+                pattern: Some(Py::new(py, PyPattern::new(py, pattern)?)?),
+                owners: Some(
+                    owners
+                        .iter()
+                        .map(|owner| Py::new(py, PyOwner::new(py, owner)?))
+                        .collect::<PyResult<Vec<_>>>()?,
+                ),
+                ..PyLineKind::empty(Tag::Rule)
             },
-            LineKind::Invalid { raw, error } => PyLineKind::Invalid {
-                raw: raw.clone(),
-                error: error.clone(),
+            LineKind::Invalid { raw, error } => PyLineKind {
+                raw: Some(SharedStr::new(py, raw)),
+                error: Some(SharedStr::new(py, error)),
+                ..PyLineKind::empty(Tag::Invalid)
             },
+        })
+    }
+}
+
+impl PartialEq for PyLineKind {
+    fn eq(&self, other: &Self) -> bool {
+        self.kind == other.kind
+            && self.content == other.content
+            && match (&self.pattern, &other.pattern) {
+                (Some(a), Some(b)) => py_eq(a, b),
+                (a, b) => a.is_none() && b.is_none(),
+            }
+            && match (&self.owners, &other.owners) {
+                (Some(a), Some(b)) => py_seq_eq(a, b),
+                (a, b) => a.is_none() && b.is_none(),
+            }
+            && self.raw == other.raw
+            && self.error == other.error
+    }
+}
+
+impl FieldMapping for PyLineKind {
+    fn field_keys(&self) -> Vec<&'static str> {
+        let mut keys = vec!["type"];
+        if self.content.is_some() {
+            keys.push("content");
+        }
+        if self.pattern.is_some() {
+            keys.push("pattern");
+        }
+        if self.owners.is_some() {
+            keys.push("owners");
+        }
+        if self.raw.is_some() {
+            keys.push("raw");
+        }
+        if self.error.is_some() {
+            keys.push("error");
+        }
+        keys
+    }
+
+    fn field<'py>(&self, py: Python<'py>, key: &str) -> PyResult<Option<Bound<'py, PyAny>>> {
+        match key {
+            "type" => some_py(py, self.kind),
+            "content" => self.content.as_ref().map_or(Ok(None), |v| some_py(py, v)),
+            "pattern" => self.pattern.as_ref().map_or(Ok(None), |v| some_py(py, v)),
+            "owners" => self.owners.as_ref().map_or(Ok(None), |v| some_py(py, v)),
+            "raw" => self.raw.as_ref().map_or(Ok(None), |v| some_py(py, v)),
+            "error" => self.error.as_ref().map_or(Ok(None), |v| some_py(py, v)),
+            _ => Ok(None),
         }
     }
 }
 
 /// Python wrapper for Line.
-#[derive(Debug, Clone, Serialize)]
+///
+/// The kind and span are stored as Python objects, so repeated access hands
+/// out the same instances instead of copying them.
+#[pyclass(frozen, eq, name = "Line", module = "codeowners_validator")]
+#[derive(Debug, Serialize)]
 pub struct PyLine {
-    pub kind: PyLineKind,
-    pub span: PySpan,
+    #[pyo3(get)]
+    #[serde(serialize_with = "serialize_py")]
+    pub kind: Py<PyLineKind>,
+    #[pyo3(get)]
+    #[serde(serialize_with = "serialize_py")]
+    pub span: Py<PySpan>,
 }
 
-impl From<&Line> for PyLine {
-    fn from(line: &Line) -> Self {
-        Self {
-            kind: PyLineKind::from(&line.kind),
-            span: PySpan::from(&line.span),
+impl PyLine {
+    /// Builds the Python line (and its nested objects) from a core line.
+    pub fn new(py: Python<'_>, line: &Line) -> PyResult<Self> {
+        Ok(Self {
+            kind: Py::new(py, PyLineKind::new(py, &line.kind)?)?,
+            span: Py::new(py, PySpan::from(&line.span))?,
+        })
+    }
+}
+
+impl PartialEq for PyLine {
+    fn eq(&self, other: &Self) -> bool {
+        py_eq(&self.kind, &other.kind) && py_eq(&self.span, &other.span)
+    }
+}
+
+impl FieldMapping for PyLine {
+    fn field_keys(&self) -> Vec<&'static str> {
+        vec!["kind", "span"]
+    }
+
+    fn field<'py>(&self, py: Python<'py>, key: &str) -> PyResult<Option<Bound<'py, PyAny>>> {
+        match key {
+            "kind" => some_py(py, &self.kind),
+            "span" => some_py(py, &self.span),
+            _ => Ok(None),
         }
     }
 }
 
-impl PyLine {
-    /// Convert to a Python object using pythonize.
-    pub fn to_py(&self, py: Python<'_>) -> PyResult<Py<PyAny>> {
-        pythonize(py, self)
-            .map(|bound| bound.unbind())
-            .map_err(|e| pyo3::exceptions::PyValueError::new_err(e.to_string()))
+/// Python wrapper for the parsed AST.
+///
+/// Lines are stored as Python objects so that repeated access to `lines`
+/// hands out the same `Line` instances instead of rebuilding them.
+#[pyclass(frozen, eq, name = "Ast", module = "codeowners_validator")]
+#[derive(Debug, Serialize)]
+pub struct PyAst {
+    #[pyo3(get)]
+    #[serde(serialize_with = "serialize_py_seq")]
+    pub lines: Vec<Py<PyLine>>,
+}
+
+impl PartialEq for PyAst {
+    fn eq(&self, other: &Self) -> bool {
+        py_seq_eq(&self.lines, &other.lines)
+    }
+}
+
+impl FieldMapping for PyAst {
+    fn field_keys(&self) -> Vec<&'static str> {
+        vec!["lines"]
+    }
+
+    fn field<'py>(&self, py: Python<'py>, key: &str) -> PyResult<Option<Bound<'py, PyAny>>> {
+        match key {
+            "lines" => some_py(py, &self.lines),
+            _ => Ok(None),
+        }
+    }
+}
+
+/// Python wrapper for the result of parsing a CODEOWNERS file.
+#[pyclass(frozen, eq, name = "ParseResult", module = "codeowners_validator")]
+#[derive(Debug, Serialize)]
+pub struct PyParseResult {
+    #[pyo3(get)]
+    pub is_ok: bool,
+    #[pyo3(get)]
+    #[serde(serialize_with = "serialize_py")]
+    pub ast: Py<PyAst>,
+    #[pyo3(get)]
+    pub errors: Vec<SharedStr>,
+}
+
+impl PyParseResult {
+    /// Builds the Python parse result from a core parse result.
+    pub fn new(py: Python<'_>, result: &ParseResult) -> PyResult<Self> {
+        let lines = result
+            .ast
+            .lines
+            .iter()
+            .map(|line| Py::new(py, PyLine::new(py, line)?))
+            .collect::<PyResult<Vec<_>>>()?;
+        Ok(Self {
+            is_ok: result.is_ok(),
+            ast: Py::new(py, PyAst { lines })?,
+            errors: result
+                .errors
+                .iter()
+                .map(|e| SharedStr::new(py, &e.to_string()))
+                .collect(),
+        })
+    }
+}
+
+impl PartialEq for PyParseResult {
+    fn eq(&self, other: &Self) -> bool {
+        self.is_ok == other.is_ok && self.errors == other.errors && py_eq(&self.ast, &other.ast)
+    }
+}
+
+impl FieldMapping for PyParseResult {
+    fn field_keys(&self) -> Vec<&'static str> {
+        vec!["is_ok", "ast", "errors"]
+    }
+
+    fn field<'py>(&self, py: Python<'py>, key: &str) -> PyResult<Option<Bound<'py, PyAny>>> {
+        match key {
+            "is_ok" => some_py(py, self.is_ok),
+            "ast" => some_py(py, &self.ast),
+            "errors" => some_py(py, &self.errors),
+            _ => Ok(None),
+        }
     }
 }
 
+mapping_protocol!(
+    PySpan,
+    PyOwner,
+    PyPattern,
+    PyLineKind,
+    PyLine,
+    PyAst,
+    PyParseResult
+);
+
 /// Python wrapper for Severity.
 #[derive(Debug, Clone, Copy, Serialize)]
 #[serde(rename_all = "lowercase")]
@@ -166,6 +718,20 @@ impl From<Severity> for PySeverity {
     }
 }
 
+impl<'py> IntoPyObject<'py> for PySeverity {
+    type Target = PyString;
+    type Output = Bound<'py, PyString>;
+    type Error = Infallible;
+
+    fn into_pyobject(self, py: Python<'py>) -> Result<Self::Output, Self::Error> {
+        let severity = match self {
+            PySeverity::Warning => intern!(py, "warning"),
+            PySeverity::Error => intern!(py, "error"),
+        };
+        Ok(severity.clone())
+    }
+}
+
 /// Python wrapper for ValidationError (as a single issue).
 #[derive(Debug, Clone, Serialize)]
 pub struct PyIssue {
@@ -188,10 +754,21 @@ impl PyIssue {
 }
 
 impl PyIssue {
-    /// Convert to a Python object using pythonize.
+    /// Convert to a Python dict.
+    ///
+    /// Keys and the severity value are interned strings shared by all issues.
     pub fn to_py(&self, py: Python<'_>) -> PyResult<Py<PyAny>> {
-        pythonize(py, self)
-            .map(|bound| bound.unbind())
-            .map_err(|e| pyo3::exceptions::PyValueError::new_err(e.to_string()))
+        let span = PyDict::new(py);
+        span.set_item(intern!(py, "offset"), self.span.offset)?;
+        span.set_item(intern!(py, "line"), self.span.line)?;
+        span.set_item(intern!(py, "column"), self.span.column)?;
+        span.set_item(intern!(py, "length"), self.span.length)?;
+
+        let issue = PyDict::new(py);
+        issue.set_item(intern!(py, "path"), &self.path)?;
+        issue.set_item(intern!(py, "span"), span)?;
+        issue.set_item(intern!(py, "message"), &self.message)?;
+        issue.set_item(intern!(py, "severity"), self.severity)?;
+        Ok(issue.into_any().unbind())
     }
 }
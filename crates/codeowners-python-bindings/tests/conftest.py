@@ -1,14 +1,18 @@
 """Pytest configuration and shared fixtures for benchmarks."""
 
-from functools import cache
+import os
+import shutil
+import stat
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import pytest
-from codeowners_validator import generate_codeowners_fixture
+from codeowners_validator import HAS_GENERATE, PatternVocabulary, generate_codeowners_fixture
 
 
 def pytest_configure(config):
-    """Configure pytest."""
+    """Configure pytest markers."""
     config.addinivalue_line("markers", "asyncio: mark test as async")
     config.addinivalue_line("markers", "benchmark: mark test as benchmark")
 
@@ -21,16 +25,57 @@ FIXTURE_CONFIGS: dict[str, tuple[int, int]] = {
     "xlarge": (10_000, 500),
 }
 
+# Generated fixture contents by size, filled on first use and shared by every fixture
+_FIXTURE_CONTENTS = pytest.StashKey[dict[str, str]]()
+
+# Generator vocabulary, expanded on first use and shared by every fixture size
+_VOCAB = pytest.StashKey["PatternVocabulary"]()
+
+
+def _fixture_content(config: pytest.Config, name: str) -> str:
+    """Return the generated CODEOWNERS fixture ``name``, generating it on first use."""
+    if not HAS_GENERATE:
+        pytest.skip("codeowners_validator was built without the 'generate' feature")
+    contents = config.stash.setdefault(_FIXTURE_CONTENTS, {})
+    content = contents.get(name)
+    if content is None:
+        vocab = config.stash.get(_VOCAB, None)
+        if vocab is None:
+            vocab = config.stash[_VOCAB] = PatternVocabulary()
+        rules, comments = FIXTURE_CONFIGS[name]
+        content = contents[name] = generate_codeowners_fixture(num_rules=rules, num_comments=comments, vocab=vocab)
+    return content
+
+
 # Extensions and directories matching the Rust generator vocabulary
 EXTENSIONS = ["rs", "py", "js", "ts", "go", "md", "yaml", "json", "toml"]
 DIRECTORIES = ["src", "lib", "tests", "docs", "config", "scripts", "api", "core"]
 
+# mknod creates a regular file in one syscall (no open/close pair) on Linux
+_USE_MKNOD = sys.platform == "linux"
+
+# Below this many files, thread start-up costs more than the overlapped I/O saves
+_PARALLEL_TOUCH_THRESHOLD = 64
+
+# Upper bound on threads creating files; each one gets a contiguous slice of paths
+_MAX_TOUCH_WORKERS = 32
 
-@cache
-def _generate_fixture(name: str) -> str:
-    """Generate and cache a fixture by name."""
-    rules, comments = FIXTURE_CONFIGS[name]
-    return generate_codeowners_fixture(num_rules=rules, num_comments=comments)
+
+def _touch(path: str) -> None:
+    """Create an empty file with ``mknod`` where allowed, else a single open/close."""
+    if _USE_MKNOD:
+        try:
+            os.mknod(path, stat.S_IFREG | 0o644)
+            return
+        except OSError:
+            pass  # mknod denied by the filesystem or the file exists; fall back
+    os.close(os.open(path, os.O_CREAT | os.O_WRONLY, 0o644))
+
+
+def _touch_all(paths: list[str]) -> None:
+    """Create each of ``paths`` as an empty file."""
+    for path in paths:
+        _touch(path)
 
 
 def create_benchmark_repo(root: Path) -> None:
@@ -41,85 +86,115 @@ def create_benchmark_repo(root: Path) -> None:
     - Directories: src, lib, tests, docs, config, scripts, api, core
     - Nested files for ** glob patterns
     - Test files for test_* patterns
+
+    Paths are collected as plain strings in a single pass over the layout,
+    then directories and files are created in two batches using raw ``os``
+    calls. Directories are created parents-first, one ``mkdir`` each, so
+    ``root`` must exist and be empty. File creation is split into one slice
+    per thread-pool worker so the syscalls overlap.
     """
-    # Create root-level files for each extension (matches *.{ext})
-    for ext in EXTENSIONS:
-        (root / f"file.{ext}").touch()
+    join = os.path.join
+    root_str = os.fspath(root)
+    src = join(root_str, "src")
+    docs_sub = join(root_str, "docs", "guide")
+    vendor = join(root_str, "vendor")
+    # Parents of the fixed subdirectories are listed explicitly so the
+    # parents-first mkdir below does not depend on DIRECTORIES
+    dirs: set[str] = {src, join(root_str, "docs"), docs_sub, vendor}
+    files: list[str] = [
+        # docs/**/*.md structure
+        join(docs_sub, "README.md"),
+        join(docs_sub, "guide.md"),
+        # vendor directory (for !vendor/ negation patterns)
+        join(vendor, "external.rs"),
+    ]
 
-    # Create directory structure with files
     for dir_name in DIRECTORIES:
-        dir_path = root / dir_name
-        dir_path.mkdir(parents=True, exist_ok=True)
-
-        # Files in directory (matches /{dir}/*.{ext})
-        for ext in EXTENSIONS:
-            (dir_path / f"file.{ext}").touch()
-
+        dir_path = join(root_str, dir_name)
         # Nested subdirectory (matches /{dir}/**)
-        sub_dir = dir_path / "sub"
-        sub_dir.mkdir(exist_ok=True)
-        for ext in EXTENSIONS:
-            (sub_dir / f"nested.{ext}").touch()
-            # Test files (matches /{dir}/**/test_*.{ext})
-            (sub_dir / f"test_example.{ext}").touch()
-
-    # Create /src/{dir}/ structure
-    for dir_name in DIRECTORIES:
-        dir_path = root / "src" / dir_name
-        dir_path.mkdir(parents=True, exist_ok=True)
-        (dir_path / "mod.rs").touch()
-
-    # Create docs/**/*.md structure
-    docs_sub = root / "docs" / "guide"
-    docs_sub.mkdir(parents=True, exist_ok=True)
-    (docs_sub / "README.md").touch()
-    (docs_sub / "guide.md").touch()
+        sub_dir = join(dir_path, "sub")
+        # /src/{dir}/ structure
+        src_dir = join(src, dir_name)
+        dirs.update((dir_path, sub_dir, src_dir))
+        files.append(join(src_dir, "mod.rs"))
 
-    # Create vendor directory (for !vendor/ negation patterns)
-    vendor = root / "vendor"
-    vendor.mkdir(exist_ok=True)
-    (vendor / "external.rs").touch()
+        for ext in EXTENSIONS:
+            files.append(join(dir_path, f"file.{ext}"))  # matches /{dir}/*.{ext}
+            files.append(join(sub_dir, f"nested.{ext}"))
+            files.append(join(sub_dir, f"test_example.{ext}"))  # matches /{dir}/**/test_*.{ext}
+
+    # Root-level files for each extension (matches *.{ext})
+    files.extend(join(root_str, f"file.{ext}") for ext in EXTENSIONS)
+
+    # Sorting puts every parent before its children
+    for dir_path in sorted(dirs):
+        os.mkdir(dir_path)
+    if len(files) > _PARALLEL_TOUCH_THRESHOLD:
+        # ThreadPoolExecutor.map ignores chunksize, so hand each worker one slice
+        workers = min(_MAX_TOUCH_WORKERS, os.cpu_count() or 1)
+        step = -(-len(files) // workers)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            list(executor.map(_touch_all, (files[i : i + step] for i in range(0, len(files), step))))
+    else:
+        _touch_all(files)
 
 
 @pytest.fixture(scope="session")
-def fixture_small() -> str:
+def fixture_small(request) -> str:
     """Small CODEOWNERS fixture (~10 rules)."""
-    return _generate_fixture("small")
+    return _fixture_content(request.config, "small")
 
 
 @pytest.fixture(scope="session")
-def fixture_medium() -> str:
+def fixture_medium(request) -> str:
     """Medium CODEOWNERS fixture (~100 rules)."""
-    return _generate_fixture("medium")
+    return _fixture_content(request.config, "medium")
 
 
 @pytest.fixture(scope="session")
-def fixture_large() -> str:
+def fixture_large(request) -> str:
     """Large CODEOWNERS fixture (~1000 rules)."""
-    return _generate_fixture("large")
+    return _fixture_content(request.config, "large")
 
 
 @pytest.fixture(scope="session")
-def fixture_xlarge() -> str:
+def fixture_xlarge(request) -> str:
     """Extra large CODEOWNERS fixture (~10k rules)."""
-    return _generate_fixture("xlarge")
+    return _fixture_content(request.config, "xlarge")
 
 
 @pytest.fixture(scope="session", params=["small", "medium", "large"])
 def fixture_all(request) -> tuple[str, str]:
     """Parameterized fixture returning (name, content) for standard sizes."""
-    return request.param, _generate_fixture(request.param)
+    return request.param, _fixture_content(request.config, request.param)
+
+
+def _clone_benchmark_repo(template: Path, dest: Path) -> None:
+    """Copy the template tree into ``dest``, hardlinking files where possible."""
+    try:
+        shutil.copytree(template, dest, dirs_exist_ok=True, copy_function=os.link)
+    except OSError:
+        # Filesystem without hardlink support: fall back to a regular copy
+        shutil.copytree(template, dest, dirs_exist_ok=True)
+
+
+@pytest.fixture(scope="session")
+def benchmark_repo_template(tmp_path_factory) -> Path:
+    """Build the benchmark file tree once per session (without a CODEOWNERS file)."""
+    tmp = tmp_path_factory.mktemp("repo_template")
+    create_benchmark_repo(tmp)
+    return tmp
 
 
 @pytest.fixture(scope="module")
-def repo_with_codeowners(fixture_medium: str, tmp_path_factory) -> Path:
+def repo_with_codeowners(fixture_medium: str, benchmark_repo_template: Path, tmp_path_factory) -> Path:
     """Create a temporary repo with medium CODEOWNERS file (module-scoped).
 
     The repo includes files matching the generated CODEOWNERS patterns.
     """
     tmp = tmp_path_factory.mktemp("repo")
-    # Create file structure matching generated patterns
-    create_benchmark_repo(tmp)
+    # Copy file structure matching generated patterns
+    _clone_benchmark_repo(benchmark_repo_template, tmp)
     # Add CODEOWNERS file
     codeowners = tmp / ".github" / "CODEOWNERS"
     codeowners.parent.mkdir(parents=True, exist_ok=True)
@@ -128,14 +203,14 @@ def repo_with_codeowners(fixture_medium: str, tmp_path_factory) -> Path:
 
 
 @pytest.fixture(scope="module")
-def repo_with_codeowners_large(fixture_large: str, tmp_path_factory) -> Path:
+def repo_with_codeowners_large(fixture_large: str, benchmark_repo_template: Path, tmp_path_factory) -> Path:
     """Create a temporary repo with large CODEOWNERS file (module-scoped).
 
     The repo includes files matching the generated CODEOWNERS patterns.
     """
     tmp = tmp_path_factory.mktemp("repo_large")
-    # Create file structure matching generated patterns
-    create_benchmark_repo(tmp)
+    # Copy file structure matching generated patterns
+    _clone_benchmark_repo(benchmark_repo_template, tmp)
     # Add CODEOWNERS file
     codeowners = tmp / ".github" / "CODEOWNERS"
     codeowners.parent.mkdir(parents=True, exist_ok=True)
@@ -9,10 +9,17 @@ Filter by group:
 """
 
 import asyncio
+import atexit
 import threading
 
 import pytest
-from codeowners_validator import parse_codeowners, validate_codeowners
+
+try:
+    import uvloop
+except ImportError:  # optional; the stock asyncio loop is used instead
+    uvloop = None
+
+from codeowners_validator import compile_codeowners, parse_codeowners, validate_codeowners, validate_codeowners_batch
 
 # Check profiles
 STANDARD_CHECKS = ["syntax", "duppatterns", "files"]
@@ -20,20 +27,18 @@ EXPERIMENTAL_CHECKS = ["notowned", "avoid-shadowing"]
 ALL_CHECKS = STANDARD_CHECKS + EXPERIMENTAL_CHECKS
 
 
-# Thread-local event loop to avoid issues with parallel pytest
-_thread_local = threading.local()
-
-
-def _get_loop() -> asyncio.AbstractEventLoop:
-    """Get or create a thread-local reusable event loop."""
-    if not hasattr(_thread_local, "loop") or _thread_local.loop.is_closed():
-        _thread_local.loop = asyncio.new_event_loop()
-    return _thread_local.loop
+# One event loop for the whole module, kept running on a daemon thread so each
+# benchmark iteration only pays for a Future hand-off, not loop bring-up. uvloop,
+# when installed, cuts the per-iteration scheduling overhead further. Only this
+# loop is affected; the global event loop policy is left alone.
+_LOOP = uvloop.new_event_loop() if uvloop is not None else asyncio.new_event_loop()
+threading.Thread(target=_LOOP.run_forever, name="benchmark-loop", daemon=True).start()
+atexit.register(_LOOP.call_soon_threadsafe, _LOOP.stop)
 
 
 def _run_async(coro):
-    """Run async function using thread-local event loop."""
-    return _get_loop().run_until_complete(coro)
+    """Run async function on the persistent benchmark event loop."""
+    return asyncio.run_coroutine_threadsafe(coro, _LOOP).result()
 
 
 class TestParseBenchmarks:
@@ -44,7 +49,8 @@ class TestParseBenchmarks:
     def test_parse(self, benchmark, fixture_name, request):
         """Benchmark parsing across fixture sizes."""
         fixture = request.getfixturevalue(f"fixture_{fixture_name}")
-        result = benchmark(parse_codeowners, fixture)
+        # Bypass the result cache so the Rust parser is what gets measured
+        result = benchmark(parse_codeowners.__wrapped__, fixture)
         assert result["is_ok"]
 
 
@@ -55,9 +61,10 @@ class TestStandardChecksBenchmarks:
     @pytest.mark.parametrize("check", STANDARD_CHECKS)
     def test_individual_check(self, benchmark, check, repo_with_codeowners):
         """Benchmark each standard check individually."""
+        repo_str = str(repo_with_codeowners)
 
         async def run():
-            return await validate_codeowners(str(repo_with_codeowners), checks=[check])
+            return await validate_codeowners(repo_str, checks=[check])
 
         result = benchmark(lambda: _run_async(run()))
         assert check in result
@@ -65,9 +72,37 @@ class TestStandardChecksBenchmarks:
     @pytest.mark.benchmark(group="checks/standard")
     def test_all_standard_checks(self, benchmark, repo_with_codeowners):
         """Benchmark all standard checks combined."""
+        repo_str = str(repo_with_codeowners)
+
+        async def run():
+            return await validate_codeowners(repo_str, checks=STANDARD_CHECKS)
+
+        result = benchmark(lambda: _run_async(run()))
+        for check in STANDARD_CHECKS:
+            assert check in result
+
+    @pytest.mark.benchmark(group="checks/standard")
+    def test_individual_checks_batched(self, benchmark, repo_with_codeowners):
+        """Benchmark each standard check as its own group in one batched call."""
+        repo_str = str(repo_with_codeowners)
+        check_groups = [[check] for check in STANDARD_CHECKS]
+
+        async def run():
+            return await validate_codeowners_batch(repo_str, check_groups)
+
+        results = benchmark(lambda: _run_async(run()))
+        assert len(results) == len(STANDARD_CHECKS)
+        for check, result in zip(STANDARD_CHECKS, results, strict=True):
+            assert check in result
+
+    @pytest.mark.benchmark(group="checks/standard")
+    def test_all_standard_checks_compiled(self, benchmark, repo_with_codeowners, fixture_medium):
+        """Benchmark all standard checks against content parsed once up front."""
+        repo_str = str(repo_with_codeowners)
+        compiled = compile_codeowners(fixture_medium)
 
         async def run():
-            return await validate_codeowners(str(repo_with_codeowners), checks=STANDARD_CHECKS)
+            return await compiled.validate(repo_str, checks=STANDARD_CHECKS)
 
         result = benchmark(lambda: _run_async(run()))
         for check in STANDARD_CHECKS:
@@ -81,9 +116,10 @@ class TestExperimentalChecksBenchmarks:
     @pytest.mark.parametrize("check", EXPERIMENTAL_CHECKS)
     def test_individual_check(self, benchmark, check, repo_with_codeowners):
         """Benchmark each experimental check individually."""
+        repo_str = str(repo_with_codeowners)
 
         async def run():
-            return await validate_codeowners(str(repo_with_codeowners), checks=[check])
+            return await validate_codeowners(repo_str, checks=[check])
 
         result = benchmark(lambda: _run_async(run()))
         assert check in result
@@ -91,9 +127,10 @@ class TestExperimentalChecksBenchmarks:
     @pytest.mark.benchmark(group="checks/experimental")
     def test_all_experimental_checks(self, benchmark, repo_with_codeowners):
         """Benchmark all experimental checks combined."""
+        repo_str = str(repo_with_codeowners)
 
         async def run():
-            return await validate_codeowners(str(repo_with_codeowners), checks=EXPERIMENTAL_CHECKS)
+            return await validate_codeowners(repo_str, checks=EXPERIMENTAL_CHECKS)
 
         result = benchmark(lambda: _run_async(run()))
         for check in EXPERIMENTAL_CHECKS:
@@ -106,9 +143,10 @@ class TestCombinedBenchmarks:
     @pytest.mark.benchmark(group="combined")
     def test_all_checks_large(self, benchmark, repo_with_codeowners_large):
         """Benchmark all checks on large file - worst case scenario."""
+        repo_str = str(repo_with_codeowners_large)
 
         async def run():
-            return await validate_codeowners(str(repo_with_codeowners_large), checks=ALL_CHECKS)
+            return await validate_codeowners(repo_str, checks=ALL_CHECKS)
 
         result = benchmark(lambda: _run_async(run()))
         for check in ALL_CHECKS:
@@ -1,176 +1,335 @@
 """Tests for the codeowners_validator package."""
 
+import os
+import shutil
 import tempfile
-from collections.abc import Generator
-from pathlib import Path
-from typing import TYPE_CHECKING, Literal
+from collections.abc import Generator, Iterable
+from typing import TYPE_CHECKING, Any, Literal
 
+import codeowners_validator
 import pytest
+from codeowners_validator import (
+    CompiledCheckConfig,
+    PatternVocabulary,
+    _types,
+    compile_check_config,
+    compile_codeowners,
+    generate_codeowners_fixture,
+    generate_codeowners_lines,
+    parse_codeowners,
+    validate_codeowners,
+    validate_codeowners_batch,
+)
 
 if TYPE_CHECKING:
     from codeowners_validator._codeowners_validator import CheckConfigDict
 
 
+TeamStatus = Literal["exists", "not_found", "unauthorized"]
+
+
 class MockGithubClient:
-    """A mock GitHub client for testing."""
+    """A mock GitHub client for testing.
+
+    Every call is recorded in ``user_calls``/``team_calls``; answers are
+    memoized per argument, so repeated lookups are a single dict hit. The
+    known users and teams are frozen, so one instance can be shared between
+    tests as long as ``reset()`` clears the call log in between.
+    """
 
     def __init__(
         self,
-        existing_users: set[str] | None = None,
-        existing_teams: set[tuple[str, str]] | None = None,
-        unauthorized_teams: set[tuple[str, str]] | None = None,
+        existing_users: Iterable[str] = (),
+        existing_teams: Iterable[tuple[str, str]] = (),
+        unauthorized_teams: Iterable[tuple[str, str]] = (),
     ):
-        self.existing_users = existing_users or set()
-        self.existing_teams = existing_teams or set()
-        self.unauthorized_teams = unauthorized_teams or set()
+        self.existing_users = frozenset(existing_users)
+        self.existing_teams = frozenset(existing_teams)
+        self.unauthorized_teams = frozenset(unauthorized_teams)
         self.user_calls: list[str] = []
         self.team_calls: list[tuple[str, str]] = []
+        self._user_cache: dict[str, bool] = {}
+        self._team_cache: dict[tuple[str, str], TeamStatus] = {}
+
+    def reset(self) -> None:
+        """Clear the recorded calls (memoized answers stay valid)."""
+        self.user_calls.clear()
+        self.team_calls.clear()
 
     def user_exists(self, username: str) -> bool:
         self.user_calls.append(username)
-        return username in self.existing_users
-
-    def team_exists(self, org: str, team: str) -> Literal["exists", "not_found", "unauthorized"]:
-        self.team_calls.append((org, team))
-        if (org, team) in self.unauthorized_teams:
-            return "unauthorized"
-        if (org, team) in self.existing_teams:
-            return "exists"
-        return "not_found"
+        exists = self._user_cache.get(username)
+        if exists is None:
+            exists = self._user_cache[username] = username in self.existing_users
+        return exists
+
+    def team_exists(self, org: str, team: str) -> TeamStatus:
+        key = (org, team)
+        self.team_calls.append(key)
+        status = self._team_cache.get(key)
+        if status is None:
+            if key in self.unauthorized_teams:
+                status = "unauthorized"
+            elif key in self.existing_teams:
+                status = "exists"
+            else:
+                status = "not_found"
+            self._team_cache[key] = status
+        return status
 
 
 class AsyncMockGithubClient:
-    """An async mock GitHub client for testing."""
+    """An async mock GitHub client for testing, with memoized answers."""
 
     def __init__(
         self,
-        existing_users: set[str] | None = None,
-        existing_teams: set[tuple[str, str]] | None = None,
+        existing_users: Iterable[str] = (),
+        existing_teams: Iterable[tuple[str, str]] = (),
     ):
-        self.existing_users = existing_users or set()
-        self.existing_teams = existing_teams or set()
+        self.existing_users = frozenset(existing_users)
+        self.existing_teams = frozenset(existing_teams)
+        self._user_cache: dict[str, bool] = {}
+        self._team_cache: dict[tuple[str, str], TeamStatus] = {}
 
     async def user_exists(self, username: str) -> bool:
-        return username in self.existing_users
-
-    async def team_exists(self, org: str, team: str) -> Literal["exists", "not_found", "unauthorized"]:
-        if (org, team) in self.existing_teams:
-            return "exists"
-        return "not_found"
+        exists = self._user_cache.get(username)
+        if exists is None:
+            exists = self._user_cache[username] = username in self.existing_users
+        return exists
+
+    async def team_exists(self, org: str, team: str) -> TeamStatus:
+        key = (org, team)
+        status = self._team_cache.get(key)
+        if status is None:
+            status = self._team_cache[key] = "exists" if key in self.existing_teams else "not_found"
+        return status
+
+
+# Read-only clients shared by the tests that only need a fixed scenario
+EMPTY_CLIENT = MockGithubClient()
+VALID_USER_CLIENT = MockGithubClient(existing_users={"validuser"})
+TEAM_CLIENT = MockGithubClient(existing_teams={("myorg", "myteam")})
+UNAUTHORIZED_TEAM_CLIENT = MockGithubClient(unauthorized_teams={("privateorg", "privateteam")})
+SHARED_CLIENTS = (EMPTY_CLIENT, VALID_USER_CLIENT, TEAM_CLIENT, UNAUTHORIZED_TEAM_CLIENT)
+
+
+@pytest.fixture(autouse=True)
+def reset_shared_clients() -> None:
+    """Give every test a clean call log on the shared mock clients."""
+    for client in SHARED_CLIENTS:
+        client.reset()
+
+
+@pytest.fixture(scope="session")
+def temp_repo_template(tmp_path_factory) -> str:
+    """Build the test repository tree once per session (without a CODEOWNERS file)."""
+    root = os.fspath(tmp_path_factory.mktemp("temp_repo_template"))
+    # Create .github directory for CODEOWNERS alongside the source directories
+    for dir_name in ("src", "docs", ".github"):
+        os.mkdir(os.path.join(root, dir_name))
+    for file_name in ("README.md", "src/main.rs", "src/lib.rs", "docs/README.md"):
+        os.close(os.open(os.path.join(root, file_name), os.O_CREAT | os.O_WRONLY, 0o644))
+    return root
 
 
 @pytest.fixture
-def temp_repo() -> Generator[str, None, None]:
-    """Create a temporary repository with some files for testing."""
+def temp_repo(temp_repo_template: str) -> Generator[str, None, None]:
+    """Create a temporary repository with some files for testing.
+
+    Each test gets its own copy of the session template, so writing a
+    CODEOWNERS file never leaks between tests.
+    """
     with tempfile.TemporaryDirectory() as tmpdir:
-        # Create some files
-        Path(tmpdir, "README.md").touch()
-        Path(tmpdir, "src").mkdir()
-        Path(tmpdir, "src/main.rs").touch()
-        Path(tmpdir, "src/lib.rs").touch()
-        Path(tmpdir, "docs").mkdir()
-        Path(tmpdir, "docs/README.md").touch()
-        # Create .github directory for CODEOWNERS
-        Path(tmpdir, ".github").mkdir()
+        shutil.copytree(temp_repo_template, tmpdir, dirs_exist_ok=True)
         yield tmpdir
 
 
+# CODEOWNERS contents shared by several tests, pre-encoded for write_codeowners_bytes
+CODEOWNERS_SIMPLE = b"*.rs @rustacean\n"
+CODEOWNERS_DUPLICATE = b"*.rs @user1\n*.rs @user2\n"
+CODEOWNERS_IGNORED_USER = b"*.rs @ignored-user\n"
+
+
 def write_codeowners(repo_path: str, content: str) -> None:
     """Helper to write a CODEOWNERS file in a repository."""
-    codeowners_path = Path(repo_path, ".github", "CODEOWNERS")
-    codeowners_path.write_text(content)
+    with open(os.path.join(repo_path, ".github", "CODEOWNERS"), "w") as f:
+        f.write(content)
+
+
+def write_codeowners_bytes(repo_path: str, data: bytes) -> None:
+    """Helper to write pre-encoded CODEOWNERS content with a single write."""
+    fd = os.open(os.path.join(repo_path, ".github", "CODEOWNERS"), os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, data)
+    finally:
+        os.close(fd)
+
+
+def assert_subset(actual: Any, expected: Any) -> None:
+    """Helper to assert that every key in ``expected`` matches ``actual``, recursing into dicts and lists."""
+    if isinstance(expected, dict):
+        for key, value in expected.items():
+            assert key in actual, key
+            assert_subset(actual[key], value)
+    elif isinstance(expected, list):
+        assert len(actual) == len(expected)
+        for actual_item, expected_item in zip(actual, expected, strict=True):
+            assert_subset(actual_item, expected_item)
+    else:
+        assert actual == expected
 
 
 class TestParseCodeowners:
     """Tests for parse_codeowners function."""
 
-    def test_parse_simple_rule(self):
-        """Test parsing a simple CODEOWNERS rule."""
-        from codeowners_validator import parse_codeowners
-
-        result = parse_codeowners("*.rs @rustacean\n")
+    @pytest.mark.parametrize(
+        ("src", "expected"),
+        [
+            (
+                "*.rs @rustacean\n",
+                {"type": "rule", "pattern": {"text": "*.rs"}, "owners": [{"type": "user", "name": "rustacean"}]},
+            ),
+            (
+                "/docs/ @github/docs-team\n",
+                {"type": "rule", "owners": [{"type": "team", "org": "github", "team": "docs-team"}]},
+            ),
+            (
+                "*.md user@example.com\n",
+                {"type": "rule", "owners": [{"type": "email", "email": "user@example.com"}]},
+            ),
+            (
+                "*.rs @user1 @org/team @user2\n",
+                {
+                    "type": "rule",
+                    "owners": [
+                        {"type": "user", "name": "user1"},
+                        {"type": "team", "org": "org", "team": "team"},
+                        {"type": "user", "name": "user2"},
+                    ],
+                },
+            ),
+            ("# This is a comment\n", {"type": "comment", "content": " This is a comment"}),
+            ("\n", {"type": "blank"}),
+        ],
+        ids=["simple", "team", "email", "multi", "comment", "blank"],
+    )
+    def test_parse_single_line(self, src: str, expected: dict[str, Any]) -> None:
+        """Test parsing a single line into the expected line kind."""
+        result = parse_codeowners(src)
 
         assert result["is_ok"] is True
         assert len(result["errors"]) == 0
         assert len(result["ast"]["lines"]) == 1
+        assert_subset(result["ast"]["lines"][0]["kind"], expected)
 
-        line = result["ast"]["lines"][0]
-        assert line["kind"].get("type") == "rule"
-        assert line["kind"].get("pattern", {}).get("text") == "*.rs"
-        assert len(line["kind"].get("owners", [])) == 1
-        assert line["kind"].get("owners", [])[0].get("type") == "user"
-        assert line["kind"].get("owners", [])[0].get("name") == "rustacean"
+    def test_parse_mixed_content(self):
+        """Test parsing a file with mixed content."""
+        content = """# CODEOWNERS file
+*.rs @rustacean
+
+/docs/ @github/docs-team
+"""
+        result = parse_codeowners(content)
 
-    def test_parse_team_owner(self):
-        """Test parsing a rule with a team owner."""
-        from codeowners_validator import parse_codeowners
+        assert result["is_ok"] is True
+        assert len(result["ast"]["lines"]) == 4  # comment, rule, blank, rule
 
-        result = parse_codeowners("/docs/ @github/docs-team\n")
+    def test_parse_bytes(self):
+        """Test parsing UTF-8 encoded bytes content."""
+        result = parse_codeowners(b"*.rs @rustacean\n")
 
         assert result["is_ok"] is True
+        assert result == parse_codeowners("*.rs @rustacean\n")
+
+    def test_parse_invalid_utf8_bytes(self):
+        """Test that non-UTF-8 bytes raise UnicodeDecodeError."""
+        with pytest.raises(UnicodeDecodeError):
+            parse_codeowners(b"*.rs @\xff\n")
+
+    def test_parse_result_is_read_only(self):
+        """Test that parse results are frozen objects with dict-style access."""
+        result = parse_codeowners("*.rs @org/team\n")
+        owner = result["ast"]["lines"][0]["kind"]["owners"][0]
+
+        assert owner.type == owner["type"] == "team"
+        assert list(owner.keys()) == ["type", "org", "team", "text", "span"]
+        assert "name" not in owner
+        with pytest.raises(KeyError):
+            owner["name"]
+        with pytest.raises(AttributeError):
+            result.is_ok = False
+
+        as_dict = result.to_dict()
+        assert isinstance(as_dict, dict)
+        assert as_dict["ast"]["lines"][0]["kind"]["owners"][0]["org"] == "org"
+
+    def test_parse_result_reads_return_stored_objects(self):
+        """Test that nested objects and strings are built once and shared by every read."""
+        result = parse_codeowners("*.rs @org/team\n")
         line = result["ast"]["lines"][0]
-        assert line["kind"].get("type") == "rule"
-        owner = line["kind"].get("owners", [])[0]
-        assert owner["type"] == "team"
-        assert owner["org"] == "github"
-        assert owner["team"] == "docs-team"
+        owner = line["kind"]["owners"][0]
 
-    def test_parse_email_owner(self):
-        """Test parsing a rule with an email owner."""
-        from codeowners_validator import parse_codeowners
+        assert line["kind"] is line.kind
+        assert line["kind"]["owners"][0] is owner
+        assert owner["org"] is owner.org
+        assert owner["text"] is owner["text"]
+        assert line["kind"]["pattern"]["text"] is line.kind.pattern.text
+        assert 0 not in result
+        assert None not in owner
 
-        result = parse_codeowners("*.md user@example.com\n")
+    def test_tags_are_interned(self):
+        """Test that owner and line type tags are shared str objects, not fresh copies."""
+        result = parse_codeowners.__wrapped__("*.rs @user1 @user2\n*.md @user3\n")
+        first, second = result["ast"]["lines"]
+        owners = [*first["kind"]["owners"], *second["kind"]["owners"]]
 
-        assert result["is_ok"] is True
-        line = result["ast"]["lines"][0]
-        owner = line["kind"].get("owners", [])[0]
-        assert owner["type"] == "email"
-        assert owner["email"] == "user@example.com"
+        assert all(owner["type"] is owners[0]["type"] for owner in owners)
+        assert first["kind"]["type"] is second["kind"]["type"]
 
-    def test_parse_multiple_owners(self):
-        """Test parsing a rule with multiple owners."""
-        from codeowners_validator import parse_codeowners
+    def test_parse_is_cached(self):
+        """Test that parsing identical content returns the cached result."""
+        parse_codeowners.cache_clear()
+        first = parse_codeowners("*.rs @rustacean\n")
+        second = parse_codeowners("*.rs @rustacean\n")
 
-        result = parse_codeowners("*.rs @user1 @org/team @user2\n")
+        assert first is second
+        assert parse_codeowners.cache_info().hits == 1
 
-        assert result["is_ok"] is True
-        line = result["ast"]["lines"][0]
-        assert len(line["kind"].get("owners", [])) == 3
+        parse_codeowners.cache_clear()
+        assert parse_codeowners("*.rs @rustacean\n") is not first
 
-    def test_parse_comment(self):
-        """Test parsing a comment line."""
-        from codeowners_validator import parse_codeowners
 
-        result = parse_codeowners("# This is a comment\n")
+class TestLazyTypes:
+    """Tests for lazily resolved type exports."""
 
-        assert result["is_ok"] is True
-        line = result["ast"]["lines"][0]
-        assert line["kind"].get("type") == "comment"
-        assert line["kind"].get("content") == " This is a comment"
+    def test_types_resolve_from_types_module(self):
+        """Test that type names are importable from the package root."""
+        for name in ("CheckConfigDict", "GithubClientProtocol", "ParseResultDict"):
+            assert getattr(codeowners_validator, name) is getattr(_types, name)
 
-    def test_parse_blank_line(self):
-        """Test parsing a blank line."""
-        from codeowners_validator import parse_codeowners
+    def test_unknown_attribute_raises(self):
+        """Test that unknown names still raise AttributeError."""
+        with pytest.raises(AttributeError):
+            _ = codeowners_validator.NotAType
 
-        result = parse_codeowners("\n")
 
-        assert result["is_ok"] is True
-        line = result["ast"]["lines"][0]
-        assert line["kind"].get("type") == "blank"
+class TestGenerateCodeownersLines:
+    """Tests for generate_codeowners_lines function."""
 
-    def test_parse_mixed_content(self):
-        """Test parsing a file with mixed content."""
-        from codeowners_validator import parse_codeowners
+    def test_lines_match_fixture(self):
+        """Test that streamed lines join to the same content as the fixture."""
+        lines = list(generate_codeowners_lines(num_rules=50, num_comments=10))
 
-        content = """# CODEOWNERS file
-*.rs @rustacean
+        assert all(line.endswith("\n") for line in lines)
+        assert "".join(lines) == generate_codeowners_fixture(num_rules=50, num_comments=10)
 
-/docs/ @github/docs-team
-"""
-        result = parse_codeowners(content)
+    def test_shared_vocabulary_matches_default(self):
+        """Test that reusing a PatternVocabulary does not change the output."""
+        vocab = PatternVocabulary()
+        expected = generate_codeowners_fixture(num_rules=50, num_comments=10)
 
-        assert result["is_ok"] is True
-        assert len(result["ast"]["lines"]) == 4  # comment, rule, blank, rule
+        assert generate_codeowners_fixture(num_rules=50, num_comments=10, vocab=vocab) == expected
+        assert "".join(generate_codeowners_lines(num_rules=50, num_comments=10, vocab=vocab)) == expected
 
 
 class TestValidateCodeowners:
@@ -179,9 +338,7 @@ class TestValidateCodeowners:
     @pytest.mark.asyncio
     async def test_validate_valid_file(self, temp_repo: str) -> None:
         """Test validating a valid CODEOWNERS file."""
-        from codeowners_validator import validate_codeowners
-
-        write_codeowners(temp_repo, "*.rs @rustacean\n")
+        write_codeowners_bytes(temp_repo, CODEOWNERS_SIMPLE)
         result = await validate_codeowners(temp_repo)
 
         # Check that we got results for each check
@@ -196,26 +353,27 @@ class TestValidateCodeowners:
     @pytest.mark.asyncio
     async def test_validate_duplicate_patterns(self, temp_repo: str) -> None:
         """Test detecting duplicate patterns."""
-        from codeowners_validator import validate_codeowners
-
-        write_codeowners(
-            temp_repo,
-            """*.rs @user1
-*.rs @user2
-""",
-        )
+        write_codeowners_bytes(temp_repo, CODEOWNERS_DUPLICATE)
         result = await validate_codeowners(temp_repo)
 
         # Should detect duplicate pattern
         assert len(result["duppatterns"]) > 0
         assert any("duplicate" in issue["message"].lower() for issue in result["duppatterns"])
 
+    @pytest.mark.asyncio
+    async def test_issue_severity_is_interned(self, temp_repo: str) -> None:
+        """Test that issues share one str object per severity value."""
+        write_codeowners_bytes(temp_repo, b"/missing-a/ @user1\n/missing-b/ @user2\n")
+        result = await validate_codeowners(temp_repo, checks=["files"])
+
+        issues = result["files"]
+        assert len(issues) == 2
+        assert issues[0]["severity"] is issues[1]["severity"]
+
     @pytest.mark.asyncio
     async def test_validate_with_config(self, temp_repo: str) -> None:
         """Test validation with custom configuration."""
-        from codeowners_validator import validate_codeowners
-
-        write_codeowners(temp_repo, "*.rs @ignored-user\n")
+        write_codeowners_bytes(temp_repo, CODEOWNERS_IGNORED_USER)
         config: CheckConfigDict = {
             "ignored_owners": ["@ignored-user"],
         }
@@ -224,12 +382,28 @@ class TestValidateCodeowners:
         # Should have no errors (owner is ignored)
         assert len(result["syntax"]) == 0
 
+    @pytest.mark.asyncio
+    async def test_validate_with_compiled_config(self, temp_repo: str) -> None:
+        """Test that a compiled config gives the same result as its dict."""
+        write_codeowners_bytes(temp_repo, CODEOWNERS_IGNORED_USER)
+        config: CheckConfigDict = {"ignored_owners": ["@ignored-user"]}
+        compiled = compile_check_config(config)
+
+        assert isinstance(compiled, CompiledCheckConfig)
+        assert await validate_codeowners(temp_repo, config=compiled) == await validate_codeowners(
+            temp_repo, config=config
+        )
+
+    @pytest.mark.parametrize("config", ["x", ["a"], 5], ids=["str", "list", "int"])
+    def test_validate_rejects_invalid_config(self, temp_repo: str, config: object) -> None:
+        """Test that a config that is neither a dict nor compiled raises TypeError."""
+        with pytest.raises(TypeError):
+            validate_codeowners(temp_repo, config=config)  # type: ignore[arg-type]
+
     @pytest.mark.asyncio
     async def test_validate_specific_checks(self, temp_repo: str) -> None:
         """Test running only specific checks."""
-        from codeowners_validator import validate_codeowners
-
-        write_codeowners(temp_repo, "*.rs @rustacean\n")
+        write_codeowners_bytes(temp_repo, CODEOWNERS_SIMPLE)
         result = await validate_codeowners(temp_repo, checks=["syntax"])
 
         # Should have run syntax check
@@ -239,10 +413,8 @@ class TestValidateCodeowners:
     @pytest.mark.asyncio
     async def test_validate_notowned_check(self, temp_repo: str) -> None:
         """Test the not-owned experimental check."""
-        from codeowners_validator import validate_codeowners
-
         # Only cover .rs files, leaving other files unowned
-        write_codeowners(temp_repo, "*.rs @rustacean\n")
+        write_codeowners_bytes(temp_repo, CODEOWNERS_SIMPLE)
         result = await validate_codeowners(temp_repo, checks=["notowned"])
 
         # Should detect files not covered by any rule
@@ -252,8 +424,6 @@ class TestValidateCodeowners:
     @pytest.mark.asyncio
     async def test_validate_file_not_found(self) -> None:
         """Test that FileNotFoundError is raised when CODEOWNERS is missing."""
-        from codeowners_validator import validate_codeowners
-
         with (
             tempfile.TemporaryDirectory() as tmpdir,
             pytest.raises(FileNotFoundError, match="CODEOWNERS file not found"),
@@ -262,16 +432,58 @@ class TestValidateCodeowners:
             await validate_codeowners(tmpdir)
 
 
+class TestValidateCodeownersBatch:
+    """Tests for validate_codeowners_batch function."""
+
+    @pytest.mark.asyncio
+    async def test_batch_matches_individual_calls(self, temp_repo: str) -> None:
+        """Test that each group matches a separate validate_codeowners call."""
+        write_codeowners_bytes(temp_repo, CODEOWNERS_DUPLICATE)
+        check_groups = [["syntax"], ["duppatterns", "files"]]
+        results = await validate_codeowners_batch(temp_repo, check_groups)
+
+        assert len(results) == len(check_groups)
+        for checks, result in zip(check_groups, results, strict=True):
+            assert result == await validate_codeowners(temp_repo, checks=checks)
+        assert len(results[1]["duppatterns"]) > 0
+
+    @pytest.mark.asyncio
+    async def test_batch_file_not_found(self) -> None:
+        """Test that FileNotFoundError is raised when CODEOWNERS is missing."""
+        with (
+            tempfile.TemporaryDirectory() as tmpdir,
+            pytest.raises(FileNotFoundError, match="CODEOWNERS file not found"),
+        ):
+            await validate_codeowners_batch(tmpdir, [["syntax"]])
+
+
+class TestCompileCodeowners:
+    """Tests for compile_codeowners and CompiledCodeowners.validate."""
+
+    @pytest.mark.asyncio
+    async def test_validate_matches_validate_codeowners(self, temp_repo: str) -> None:
+        """Test that validating compiled content matches validating the file."""
+        content = "*.rs @user1\n*.rs @user2\n/missing/ @user3\n"
+        write_codeowners(temp_repo, content)
+        compiled = compile_codeowners(content)
+
+        assert compiled.path == ".github/CODEOWNERS"
+        assert compiled.parse_result == parse_codeowners(content)
+        assert compiled.ast is compiled.parse_result["ast"]
+        for checks in (["syntax"], ["files", "duppatterns"]):
+            assert await compiled.validate(temp_repo, checks=checks) == await validate_codeowners(
+                temp_repo, checks=checks
+            )
+
+
 class TestValidateWithGithub:
     """Tests for validate_codeowners with github_client."""
 
     @pytest.mark.asyncio
     async def test_validate_user_exists(self, temp_repo: str) -> None:
         """Test validation with a user that exists."""
-        from codeowners_validator import validate_codeowners
-
         write_codeowners(temp_repo, "*.rs @validuser\n")
-        client = MockGithubClient(existing_users={"validuser"})
+        client = VALID_USER_CLIENT
 
         result = await validate_codeowners(temp_repo, github_client=client)
 
@@ -282,10 +494,8 @@ class TestValidateWithGithub:
     @pytest.mark.asyncio
     async def test_validate_user_not_found(self, temp_repo: str) -> None:
         """Test validation with a user that doesn't exist."""
-        from codeowners_validator import validate_codeowners
-
         write_codeowners(temp_repo, "*.rs @ghostuser\n")
-        client = MockGithubClient()  # No users
+        client = EMPTY_CLIENT  # No users
 
         result = await validate_codeowners(temp_repo, github_client=client)
 
@@ -296,10 +506,8 @@ class TestValidateWithGithub:
     @pytest.mark.asyncio
     async def test_validate_team_exists(self, temp_repo: str) -> None:
         """Test validation with a team that exists."""
-        from codeowners_validator import validate_codeowners
-
         write_codeowners(temp_repo, "*.rs @myorg/myteam\n")
-        client = MockGithubClient(existing_teams={("myorg", "myteam")})
+        client = TEAM_CLIENT
 
         result = await validate_codeowners(temp_repo, github_client=client)
 
@@ -310,10 +518,8 @@ class TestValidateWithGithub:
     @pytest.mark.asyncio
     async def test_validate_team_unauthorized(self, temp_repo: str) -> None:
         """Test validation with a team that returns unauthorized."""
-        from codeowners_validator import validate_codeowners
-
         write_codeowners(temp_repo, "*.rs @privateorg/privateteam\n")
-        client = MockGithubClient(unauthorized_teams={("privateorg", "privateteam")})
+        client = UNAUTHORIZED_TEAM_CLIENT
 
         result = await validate_codeowners(temp_repo, github_client=client)
 
@@ -325,8 +531,6 @@ class TestValidateWithGithub:
     @pytest.mark.asyncio
     async def test_validate_with_async_client(self, temp_repo: str) -> None:
         """Test validation with an async GitHub client."""
-        from codeowners_validator import validate_codeowners
-
         write_codeowners(temp_repo, "*.rs @asyncuser\n")
         client = AsyncMockGithubClient(existing_users={"asyncuser"})
 
@@ -338,8 +542,6 @@ class TestValidateWithGithub:
     @pytest.mark.asyncio
     async def test_validate_with_owners_must_be_teams(self, temp_repo: str) -> None:
         """Test validation requiring team owners."""
-        from codeowners_validator import validate_codeowners
-
         write_codeowners(temp_repo, "*.rs @individual-user\n")
         client = MockGithubClient(existing_users={"individual-user"})
         config: CheckConfigDict = {"owners_must_be_teams": True}
@@ -352,13 +554,18 @@ class TestValidateWithGithub:
         assert any("team" in issue["message"].lower() for issue in result["owners"])
 
     @pytest.mark.asyncio
-    async def test_validate_with_ignored_owners(self, temp_repo: str) -> None:
+    @pytest.mark.parametrize(
+        "ignored_owners",
+        [["@ignored-owner"], frozenset({"@ignored-owner"})],
+        ids=["list", "frozenset"],
+    )
+    async def test_validate_with_ignored_owners(
+        self, temp_repo: str, ignored_owners: list[str] | frozenset[str]
+    ) -> None:
         """Test validation with ignored owners."""
-        from codeowners_validator import validate_codeowners
-
         write_codeowners(temp_repo, "*.rs @ignored-owner\n")
-        client = MockGithubClient()  # User doesn't exist
-        config: CheckConfigDict = {"ignored_owners": ["@ignored-owner"]}
+        client = EMPTY_CLIENT  # User doesn't exist
+        config: CheckConfigDict = {"ignored_owners": ignored_owners}
 
         result = await validate_codeowners(temp_repo, config=config, github_client=client)
 
@@ -372,8 +579,6 @@ class TestIssueFormat:
     @pytest.mark.asyncio
     async def test_issue_has_required_fields(self, temp_repo: str) -> None:
         """Test that issues have all required fields."""
-        from codeowners_validator import validate_codeowners
-
         # Create a file with a syntax issue
         write_codeowners(temp_repo, "*.rs @invalid--owner\n")  # Double hyphen might be invalid
         result = await validate_codeowners(temp_repo)
@@ -395,15 +600,8 @@ class TestIssueFormat:
     @pytest.mark.asyncio
     async def test_issue_has_path_field(self, temp_repo: str) -> None:
         """Test that issues include the path to the CODEOWNERS file."""
-        from codeowners_validator import validate_codeowners
-
         # Create duplicate patterns to generate an issue
-        write_codeowners(
-            temp_repo,
-            """*.rs @user1
-*.rs @user2
-""",
-        )
+        write_codeowners_bytes(temp_repo, CODEOWNERS_DUPLICATE)
         result = await validate_codeowners(temp_repo)
 
         # Should have duplicate pattern issues
@@ -421,8 +619,6 @@ class TestSpanFormat:
 
     def test_span_has_required_fields(self):
         """Test that spans have all required fields."""
-        from codeowners_validator import parse_codeowners
-
         result = parse_codeowners("*.rs @owner\n")
         line = result["ast"]["lines"][0]
 
@@ -7,7 +7,9 @@
 
 use crate::parse::{CodeownersFile, Line, Owner, Pattern, Span};
 use rand::prelude::*;
-use rand::rngs::StdRng;
+use rand::rngs::SmallRng;
+use std::fmt::Write;
+use std::sync::Arc;
 
 /// Configuration for generating CODEOWNERS files.
 #[derive(Debug, Clone)]
@@ -118,6 +120,55 @@ mod vocabulary {
     pub const SECTION_NAMES: &[&str] = &["Frontend", "Backend", "Infrastructure", "Documentation"];
 }
 
+/// Pattern and owner strings expanded from the generator vocabulary.
+///
+/// Building a vocabulary expands every pattern template for every
+/// extension/directory pair up front, so generation only picks strings
+/// instead of substituting placeholders for each rule. Create one and share
+/// it across generator runs to pay the expansion cost once.
+#[derive(Debug, Clone)]
+pub struct PatternVocabulary {
+    /// Expanded patterns, indexed by `(template, ext, dir)`.
+    patterns: Vec<String>,
+    /// `{username}@example.com` addresses, indexed like `USERNAMES`.
+    emails: Vec<String>,
+}
+
+impl PatternVocabulary {
+    /// Expand the built-in vocabulary.
+    pub fn new() -> Self {
+        use vocabulary::*;
+
+        let mut patterns =
+            Vec::with_capacity(PATTERN_TEMPLATES.len() * EXTENSIONS.len() * DIRECTORIES.len());
+        for template in PATTERN_TEMPLATES {
+            for ext in EXTENSIONS {
+                for dir in DIRECTORIES {
+                    patterns.push(template.replace("{ext}", ext).replace("{dir}", dir));
+                }
+            }
+        }
+        let emails = USERNAMES
+            .iter()
+            .map(|name| format!("{}@example.com", name))
+            .collect();
+
+        Self { patterns, emails }
+    }
+
+    fn pattern(&self, template: usize, ext: usize, dir: usize) -> &str {
+        use vocabulary::*;
+
+        &self.patterns[(template * EXTENSIONS.len() + ext) * DIRECTORIES.len() + dir]
+    }
+}
+
+impl Default for PatternVocabulary {
+    fn default() -> Self {
+        Self::new()
+    }
+}
+
 /// Owner type distribution weights (must sum to 100).
 const WEIGHT_USER: u32 = 50;
 const WEIGHT_TEAM: u32 = 30;
@@ -126,6 +177,11 @@ const WEIGHT_TEAM: u32 = 30;
 /// Probability of inserting a comment section header (percentage).
 const COMMENT_PROBABILITY: u32 = 20;
 
+/// Upper-end byte estimates used to preallocate generated output.
+const HEADER_BYTES: usize = 64;
+const RULE_LINE_BYTES: usize = 80;
+const COMMENT_LINE_BYTES: usize = 40;
+
 /// Placeholder span for generated AST nodes.
 ///
 /// Generated content doesn't have meaningful source positions.
@@ -135,32 +191,68 @@ fn placeholder_span() -> Span {
 
 /// Generates a random CODEOWNERS AST based on configuration.
 pub fn generate_ast(config: &GeneratorConfig) -> CodeownersFile {
-    use vocabulary::*;
+    generate_ast_with_vocabulary(config, Arc::new(PatternVocabulary::new()))
+}
 
-    let mut rng = StdRng::seed_from_u64(config.seed);
+/// Like [`generate_ast`], reusing an already expanded vocabulary.
+pub fn generate_ast_with_vocabulary(
+    config: &GeneratorConfig,
+    vocab: Arc<PatternVocabulary>,
+) -> CodeownersFile {
     let capacity = config.num_rules + config.num_comments + 10;
     let mut lines = Vec::with_capacity(capacity);
+    lines.extend(generate_lines_with_vocabulary(config, vocab));
 
-    // Header comment
-    lines.push(Line::comment(
-        " Auto-generated CODEOWNERS for benchmarking",
-        placeholder_span(),
-    ));
-    lines.push(Line::blank(placeholder_span()));
+    CodeownersFile::new(lines)
+}
+
+/// Lazily generates the lines of a random CODEOWNERS file.
+///
+/// Yields exactly the lines of [`generate_ast`] for the same configuration,
+/// but produces them one rule at a time so callers can stream large
+/// fixtures without materializing the whole file.
+pub fn generate_lines(
+    config: &GeneratorConfig,
+) -> impl Iterator<Item = Line> + Send + Sync + use<> {
+    generate_lines_with_vocabulary(config, Arc::new(PatternVocabulary::new()))
+}
+
+/// Like [`generate_lines`], reusing an already expanded vocabulary.
+pub fn generate_lines_with_vocabulary(
+    config: &GeneratorConfig,
+    vocab: Arc<PatternVocabulary>,
+) -> impl Iterator<Item = Line> + Send + Sync + use<> {
+    use vocabulary::*;
 
+    let config = config.clone();
+    let mut rng = SmallRng::seed_from_u64(config.seed);
     let mut rules_added = 0;
     let mut comments_added = 0;
 
+    // Header comment
+    let header = [
+        Line::comment(
+            " Auto-generated CODEOWNERS for benchmarking",
+            placeholder_span(),
+        ),
+        Line::blank(placeholder_span()),
+    ];
+
     // Generate rules, interspersing comments
-    while rules_added < config.num_rules {
+    let rules = std::iter::from_fn(move || {
+        if rules_added >= config.num_rules {
+            return None;
+        }
+        let mut chunk = Vec::with_capacity(3);
+
         // Maybe add a section comment
         if comments_added < config.num_comments
             && rules_added > 0
             && rng.random_ratio(COMMENT_PROBABILITY, 100)
         {
             let section = SECTION_NAMES[rng.random_range(0..SECTION_NAMES.len())];
-            lines.push(Line::blank(placeholder_span()));
-            lines.push(Line::comment(
+            chunk.push(Line::blank(placeholder_span()));
+            chunk.push(Line::comment(
                 format!(" {} section", section),
                 placeholder_span(),
             ));
@@ -168,25 +260,28 @@ pub fn generate_ast(config: &GeneratorConfig) -> CodeownersFile {
         }
 
         // Generate pattern
-        let template = PATTERN_TEMPLATES[rng.random_range(0..PATTERN_TEMPLATES.len())];
-        let ext = EXTENSIONS[rng.random_range(0..EXTENSIONS.len())];
-        let dir = DIRECTORIES[rng.random_range(0..DIRECTORIES.len())];
-        let pattern_text = template.replace("{ext}", ext).replace("{dir}", dir);
-        let pattern = Pattern::new(pattern_text, placeholder_span());
+        let template = rng.random_range(0..PATTERN_TEMPLATES.len());
+        let ext = rng.random_range(0..EXTENSIONS.len());
+        let dir = rng.random_range(0..DIRECTORIES.len());
+        let pattern = Pattern::new(vocab.pattern(template, ext, dir), placeholder_span());
 
         // Generate owners (1 to max_owners_per_rule)
         let num_owners = rng.random_range(1..=config.max_owners_per_rule);
-        let owners: Vec<Owner> = (0..num_owners).map(|_| generate_owner(&mut rng)).collect();
+        let owners: Vec<Owner> = (0..num_owners)
+            .map(|_| generate_owner(&mut rng, &vocab))
+            .collect();
 
-        lines.push(Line::rule(pattern, owners, placeholder_span()));
+        chunk.push(Line::rule(pattern, owners, placeholder_span()));
         rules_added += 1;
-    }
+        Some(chunk)
+    })
+    .flatten();
 
-    CodeownersFile::new(lines)
+    header.into_iter().chain(rules)
 }
 
 /// Generate a random owner based on weighted distribution.
-fn generate_owner(rng: &mut StdRng) -> Owner {
+fn generate_owner(rng: &mut SmallRng, vocab: &PatternVocabulary) -> Owner {
     use vocabulary::*;
 
     let roll = rng.random_range(0..100);
@@ -204,18 +299,32 @@ fn generate_owner(rng: &mut StdRng) -> Owner {
         )
     } else {
         Owner::email(
-            format!(
-                "{}@example.com",
-                USERNAMES[rng.random_range(0..USERNAMES.len())]
-            ),
+            vocab.emails[rng.random_range(0..USERNAMES.len())].as_str(),
             placeholder_span(),
         )
     }
 }
 
 /// Generates a CODEOWNERS file as a string.
+///
+/// Produces the same text as `generate_ast(config).to_string()`.
 pub fn generate(config: &GeneratorConfig) -> String {
-    generate_ast(config).to_string()
+    generate_with_vocabulary(config, Arc::new(PatternVocabulary::new()))
+}
+
+/// Like [`generate`], reusing an already expanded vocabulary.
+///
+/// Lines are written straight into a buffer sized from the configuration,
+/// without building the intermediate AST.
+pub fn generate_with_vocabulary(config: &GeneratorConfig, vocab: Arc<PatternVocabulary>) -> String {
+    let capacity = HEADER_BYTES
+        + config.num_rules * RULE_LINE_BYTES
+        + config.num_comments * COMMENT_LINE_BYTES;
+    let mut out = String::with_capacity(capacity);
+    for line in generate_lines_with_vocabulary(config, vocab) {
+        writeln!(out, "{}", line).expect("writing to a String cannot fail");
+    }
+    out
 }
 
 #[cfg(test)]
@@ -250,6 +359,33 @@ mod tests {
         assert_eq!(content1, content2, "Same seed should produce same output");
     }
 
+    #[test]
+    fn generate_matches_ast_display() {
+        for config in [GeneratorConfig::new(0), GeneratorConfig::medium()] {
+            assert_eq!(generate(&config), generate_ast(&config).to_string());
+        }
+    }
+
+    #[test]
+    fn generate_lines_matches_generate() {
+        let config = GeneratorConfig::medium();
+        let streamed: String = generate_lines(&config)
+            .map(|line| format!("{}\n", line))
+            .collect();
+        assert_eq!(streamed, generate(&config));
+    }
+
+    #[test]
+    fn shared_vocabulary_matches_generate() {
+        let vocab = Arc::new(PatternVocabulary::new());
+        for config in [GeneratorConfig::small(), GeneratorConfig::medium()] {
+            assert_eq!(
+                generate_with_vocabulary(&config, Arc::clone(&vocab)),
+                generate(&config)
+            );
+        }
+    }
+
     #[test]
     fn different_seeds_differ() {
         let content1 = generate(&GeneratorConfig::medium().with_seed(1));
@@ -63,7 +63,7 @@ pub mod validate;
 pub mod generate;
 
 #[cfg(feature = "generate")]
-pub use generate::{GeneratorConfig, generate, generate_ast};
+pub use generate::{GeneratorConfig, PatternVocabulary, generate, generate_ast};
 
 // Re-export commonly used types at the crate root
 pub use parse::{CodeownersFile, ParseResult, parse_codeowners};